@@ -0,0 +1,177 @@
+import pygame
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+def has_transparency(surface):
+    """Görselde gerçekten saydam (alpha < 255) piksel var mı kontrol et"""
+    if not surface.get_flags() & pygame.SRCALPHA and surface.get_colorkey() is None:
+        return False
+    if surface.get_colorkey() is not None:
+        return True
+    # Tamamen opak piksellerin maskesi tüm yüzeyi kaplıyorsa saydamlık yok
+    opaque = pygame.mask.from_surface(surface, 254)
+    return opaque.count() != surface.get_width() * surface.get_height()
+
+def convert_surface(surface, transparent=None):
+    """Yüzeyi ekranın piksel formatına dönüştür, formatı döndür"""
+    if pygame.display.get_surface() is None:
+        return surface, "raw"  # Ekran açılmadan dönüştürme yapılamaz
+    if transparent is None:
+        transparent = has_transparency(surface)
+    if transparent:
+        return surface.convert_alpha(), "convert_alpha"
+    return surface.convert(), "convert"
+
+class AssetManager:
+    """Çözülmüş ve boyutlandırılmış görsellerin ortak önbelleği.
+
+    Görseller (yol, boyut, dönüşüm) anahtarıyla tutulur; toplam piksel
+    belleği bütçeyi aşınca en uzun süredir kullanılmayanlar atılır (LRU).
+    Dönen yüzeyler paylaşılır, çağıranlar üzerine çizmemelidir.
+
+    prefetch ile istenen görseller bir iş parçacığında diskten çözülür;
+    ekran formatına dönüştürme (convert) ana iş parçacığında collect ya da
+    get_image sırasında yapılır. Ön yükleme bitmediyse get_image bekler,
+    hiç başlamadıysa görseli kendisi yükler.
+    """
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.images = OrderedDict()  # (yol, boyut, dönüşüm) -> (yüzey, bayt, format)
+        self.bytes = 0
+        # Her görselin hangi piksel formatına dönüştürüldüğü: (yol, boyut) -> "convert" / "convert_alpha" / "raw"
+        self.formats = {}
+        self.pending = {}  # Ön yüklemesi süren görseller: anahtar -> Future
+        self.executor = None  # İlk ön yüklemede oluşturulur
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0  # Ön yüklemeden karşılanan istekler
+
+    def get_image(self, file_path, size=None, convert=True):
+        """Görseli önbellekten döndür, yoksa diskten yükle (LRU)"""
+        size = tuple(size) if size else None
+        key = (file_path, size, "convert" if convert else "raw")
+        entry = self.images.get(key)
+        # Ekran açılmadan yüklenen görsel, ekran açıldıktan sonra dönüştürülür
+        if entry is not None and not (convert and entry[2] == "raw" and pygame.display.get_surface()):
+            self.hits += 1
+            self.images.move_to_end(key)
+            return entry[0]
+
+        decoded = self.take_prefetched(key)
+        if decoded is None:
+            self.misses += 1
+            decoded = self.decode(file_path, size, convert)
+        return self.finish(key, decoded)
+
+    def decode(self, file_path, size=None, convert=True):
+        """Görseli diskten yükle ve boyutlandır (ön yükleme iş parçacığında da çalışır).
+
+        (yüzey, saydamlık) ikilisini döndürür; dönüştürme ana iş parçacığında yapılır.
+        """
+        try:
+            if not os.path.exists(file_path):
+                print(f"Görsel dosyası bulunamadı: {file_path}")
+                return None
+
+            image = pygame.image.load(file_path)
+            if size:
+                image = pygame.transform.scale(image, size)
+            return image, convert and has_transparency(image)
+        except Exception as e:
+            print(f"Görsel dosyası yüklenemedi ({file_path}): {e}")
+            return None
+
+    def finish(self, key, decoded):
+        """Çözülmüş görseli ekran formatına dönüştür ve önbelleğe al"""
+        if decoded is None:
+            return None
+        image, transparent = decoded
+        file_path, size, mode = key
+        if mode == "convert":
+            image, mode = convert_surface(image, transparent)
+            self.formats[(file_path, size)] = mode
+        self.store(key, image, mode)
+        return image
+
+    def prefetch(self, items):
+        """(yol, boyut) görsellerini arka plan iş parçacığında çözmeye başla"""
+        for file_path, size in items:
+            size = tuple(size) if size else None
+            key = (file_path, size, "convert")
+            if key in self.images or key in self.pending:
+                continue
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-prefetch")
+            self.pending[key] = self.executor.submit(self.decode, file_path, size)
+
+    def take_prefetched(self, key):
+        """Ön yüklenen görseli al; bitmediyse bekle, başlamadıysa None döndür"""
+        future = self.pending.pop(key, None)
+        if future is None or future.cancel():
+            return None
+        self.prefetched += 1
+        return future.result()
+
+    def collect(self):
+        """Biten ön yüklemeleri dönüştürüp önbelleğe al (her karede ana iş parçacığından)"""
+        if not self.pending:
+            return
+        for key in [key for key, future in self.pending.items() if future.done()]:
+            self.finish(key, self.pending.pop(key).result())
+
+    def store(self, key, image, mode):
+        old = self.images.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        size = image.get_pitch() * image.get_height()
+        if size > self.budget_bytes:
+            return  # Bütçeden büyük görsel önbelleğe alınmaz
+        self.images[key] = (image, size, mode)
+        self.bytes += size
+        self.evict()
+
+    def evict(self):
+        """Bütçe aşıldıysa en eski kullanılanları çıkar"""
+        while self.bytes > self.budget_bytes and self.images:
+            _, (_, size, _) = self.images.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.evict()
+
+    def clear(self):
+        """Görsel önbelleğini temizle"""
+        self.images.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """Önbellek istatistiklerini döndür"""
+        total = self.hits + self.misses
+        return {
+            "images": len(self.images),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "prefetched": self.prefetched,
+            "pending": len(self.pending),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+# Tüm modüllerin kullandığı ortak görsel önbelleği
+asset_manager = AssetManager()
+
+def load_image(file_path, size=None):
+    """Görseli önbellekten ya da diskten yükle, boyutlandır ve ekran formatına dönüştür"""
+    return asset_manager.get_image(file_path, size)
+
+def get_asset_formats():
+    """Yüklenen görsellerin format kayıtlarını döndür"""
+    return dict(asset_manager.formats)
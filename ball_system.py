@@ -0,0 +1,187 @@
+import math
+import numpy as np
+import pygame
+from physics import block_normal, paddle_bounce, reflect
+
+class BallSystem:
+    """Ekstra topların (çoklu top) NumPy dizilerinde tutulduğu top sistemi.
+
+    Konum, hız ve yarıçap dizilerin başında [0, count) aralığında sıkışık
+    tutulur; hareket, duvar, platform ve kalkan testleri tek seferde yapılır.
+    """
+    def __init__(self, capacity=1024, color=(231, 76, 60)):
+        self.capacity = capacity
+        self.color = color
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.sprites = {}  # yarıçap -> önceden çizilmiş top
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def live_pos(self):
+        """Canlı topların konumları (dizinin görünümü)"""
+        return self.pos[:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y, dx, dy, radius):
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.pos[i] = (x, y)
+        self.vel[i] = (dx, dy)
+        self.radius[i] = radius
+        self.count += 1
+        return True
+
+    def spawn_burst(self, ball, amount):
+        """Ana topun konumundan rastgele yukarı açılarla amount top fırlat"""
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return
+        start, end = self.count, self.count + amount
+        angles = np.random.uniform(-3 * math.pi / 4, -math.pi / 4, amount)
+        self.pos[start:end] = (ball.x, ball.y)
+        self.vel[start:end, 0] = np.cos(angles) * ball.speed
+        self.vel[start:end, 1] = np.sin(angles) * ball.speed
+        self.radius[start:end] = ball.radius
+        self.count = end
+
+    def keep(self, indexes):
+        """Sadece verilen indeksteki topları bırak"""
+        indexes = np.asarray(indexes, dtype=np.intp)
+        kept = len(indexes)
+        self.pos[:kept] = self.pos[indexes]
+        self.vel[:kept] = self.vel[indexes]
+        self.radius[:kept] = self.radius[indexes]
+        self.count = kept
+
+    def keep_random(self, amount=1):
+        if self.count > amount:
+            self.keep(np.random.choice(self.count, amount, replace=False))
+
+    def remove_mask(self, mask):
+        """mask True olan topları at"""
+        if mask.any():
+            self.keep(np.flatnonzero(~mask))
+
+    def move(self, dt=1.0):
+        n = self.count
+        self.pos[:n] += self.vel[:n] * dt
+
+    def collide_bounds(self, screen_width, screen_height, platform, shield_top=None):
+        """Duvar, platform ve kalkan çarpışmaları; ekrandan düşen topları at.
+
+        Kalkandan seken top sayısını döndürür.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        dx, dy = self.vel[:n, 0], self.vel[:n, 1]
+        r = self.radius[:n]
+
+        # Zemine düşen toplar
+        self.remove_mask(y + r > screen_height)
+        n = self.count
+        if n == 0:
+            return 0
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        dx, dy = self.vel[:n, 0], self.vel[:n, 1]
+        r = self.radius[:n]
+
+        # Duvar çarpışmaları
+        left = x - r <= 0
+        x[left] = r[left]
+        dx[left] = np.abs(dx[left])
+        right = ~left & (x + r >= screen_width)
+        x[right] = screen_width - r[right]
+        dx[right] = -np.abs(dx[right])
+        top = y - r <= 0
+        y[top] = r[top]
+        dy[top] = np.abs(dy[top])
+
+        # Platform çarpışması (ana topla aynı açı kuralı)
+        rect = platform.rect.inflate(-10, -5)
+        on_platform = ((x + r > rect.left) & (x - r < rect.right) &
+                       (y + r > rect.top) & (y - r < rect.bottom))
+        if on_platform.any():
+            dx[on_platform], dy[on_platform] = paddle_bounce(x[on_platform], dx[on_platform],
+                                                             dy[on_platform], platform.rect)
+            y[on_platform] = platform.rect.y - r[on_platform]
+
+        # Kalkan
+        if shield_top is not None:
+            shielded = y + r >= shield_top
+            dy[shielded] = -np.abs(dy[shielded])
+            return int(np.count_nonzero(shielded))
+        return 0
+
+    def find_block_hits(self, block_manager):
+        """Bloklara değen toplar için (top indeksi, blok) çiftlerini döndür.
+
+        Adaylar blok ızgarasından toplanır, örtüşme testi top x aday blok
+        matrisi üzerinde blok dizilerinden tek seferde yapılır; her top
+        oluşturulma sırasındaki ilk bloğa vurur.
+        """
+        n = self.count
+        if n == 0 or not len(block_manager.field):
+            return []
+        x, y, r = self.pos[:n, 0], self.pos[:n, 1], self.radius[:n]
+        # pygame.Rect gibi sıfıra doğru yuvarla
+        left, top = np.trunc(x - r), np.trunc(y - r)
+        right, bottom = left + np.trunc(r * 2), top + np.trunc(r * 2)
+
+        slots = block_manager.query_slots(left, top, right, bottom)
+        if len(slots) == 0:
+            return []
+        hits, slots = block_manager.field.find_overlaps(left, top, right, bottom, slots)
+        balls = np.flatnonzero(hits.any(axis=1))
+        first = slots[hits[balls].argmax(axis=1)]
+        objects = block_manager.field.objects
+        return [(int(i), objects[slot]) for i, slot in zip(balls.tolist(), first.tolist())]
+
+    def bounce_off_block(self, i, block):
+        """Topu bloğun merkezine göre çarpma yönünde sektir (ana topla aynı yansıma)"""
+        x, y = self.pos[i]
+        normal = block_normal(x, y, block.rect)
+        dx, dy = self.vel[i]
+        if dx * normal[0] + dy * normal[1] < 0:  # Sadece yüzeye doğru gidiyorsa
+            self.vel[i] = reflect(dx, dy, normal)
+
+    def get_sprite(self, radius):
+        """Yarıçap için önceden çizilmiş top ve merkez kayması"""
+        sprite = self.sprites.get(radius)
+        if sprite is None:
+            offset = int(math.ceil(radius)) + 1
+            surface = pygame.Surface((offset * 2 + 1, offset * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, self.color, (offset, offset), radius)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            sprite = self.sprites[radius] = (surface, offset)
+        return sprite
+
+    def draw(self, screen):
+        n = self.count
+        if n == 0:
+            return
+        centers = self.pos[:n].astype(np.int32).tolist()
+        blits = []
+        for (cx, cy), radius in zip(centers, self.radius[:n].tolist()):
+            sprite, offset = self.get_sprite(radius)
+            blits.append((sprite, (cx - offset, cy - offset)))
+        screen.blits(blits, doreturn=False)
+
+    def get_draw_rects(self):
+        n = self.count
+        if n == 0:
+            return []
+        centers = self.pos[:n].astype(np.int32).tolist()
+        sizes = (self.radius[:n].astype(np.int32) + 1).tolist()
+        return [pygame.Rect(cx - size, cy - size, size * 2, size * 2)
+                for (cx, cy), size in zip(centers, sizes)]
@@ -0,0 +1,47 @@
+"""Seviye arka planlarının dönüştürülmüş ve dönüştürülmemiş blit hızlarını karşılaştırır.
+
+Kullanım: python benchmark_blit.py [tekrar_sayısı]
+"""
+import sys
+import time
+import pygame
+from assets import asset_manager, load_image, get_asset_formats
+
+BACKGROUNDS = {
+    "tas": "Assests/tas/taşlı_kısım.png",
+    "col": "Assests/col/çöl_kısmı.png",
+    "buz": "Assests/buz/Buzlu_kısım_background.png"
+}
+
+def time_blits(screen, surface, repeat):
+    """Yüzeyi ekrana repeat kez çiz, kare başına ms döndür"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        screen.blit(surface, (0, 0))
+    return (time.perf_counter() - start) * 1000 / repeat
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    screen_size = (800, 600)
+
+    pygame.init()
+    screen = pygame.display.set_mode(screen_size)
+
+    print(f"{'tema':<6}{'ham (ms)':>12}{'dönüştürülmüş (ms)':>22}{'hızlanma':>12}")
+    for theme, path in BACKGROUNDS.items():
+        # Eski yol: dönüştürülmeden ölçeklenmiş yüzey
+        raw = asset_manager.get_image(path, screen_size, convert=False)
+        converted = load_image(path, screen_size)
+
+        raw_ms = time_blits(screen, raw, repeat)
+        converted_ms = time_blits(screen, converted, repeat)
+        print(f"{theme:<6}{raw_ms:>12.3f}{converted_ms:>22.3f}{raw_ms / converted_ms:>11.1f}x")
+
+    print()
+    for (path, size), mode in get_asset_formats().items():
+        print(f"{path} {size}: {mode}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
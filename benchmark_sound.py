@@ -0,0 +1,48 @@
+"""Seslerin MP3 kaynaklarından ve transcode_audio.py çıktılarından yüklenme sürelerini karşılaştırır.
+
+Önce python transcode_audio.py çalıştırılmalıdır.
+Kullanım: python benchmark_sound.py [tekrar_sayısı]
+"""
+import os
+import sys
+import time
+import pygame
+from sound_bank import SoundBank
+from transcode_audio import find_sources, load_manifest
+
+def time_loading(paths, manifest, repeat):
+    """Sesleri boş bir bankaya repeat kez yükle, yükleme başına ms döndür"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        bank = SoundBank()
+        bank.manifest = manifest
+        bank.preload(paths)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+
+    manifest = load_manifest()
+    if not manifest:
+        print("Manifest bulunamadı, önce: python transcode_audio.py")
+    paths = list(find_sources())
+
+    print(f"{'ses':<48}{'mp3 (ms)':>10}{'dönüştürülmüş (ms)':>22}")
+    for path in paths:
+        output = manifest.get(path, {}).get("output") or "-"
+        source_ms = time_loading([path], {}, repeat)
+        transcoded_ms = time_loading([path], manifest, repeat)
+        print(f"{path:<48}{source_ms:>10.2f}{transcoded_ms:>22.2f}  {output}")
+
+    source_ms = time_loading(paths, {}, repeat)
+    transcoded_ms = time_loading(paths, manifest, repeat)
+    print()
+    print(f"toplam {len(paths)} ses: mp3 {source_ms:.1f} ms, dönüştürülmüş {transcoded_ms:.1f} ms "
+          f"({source_ms / transcoded_ms:.1f}x)")
+
+    pygame.mixer.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import pygame
+from assets import convert_surface
+from font_cache import get_font, render_text
+
+class BlockAtlas:
+    """Bir temanın blok görsellerini tek bir yüzeyde toplar"""
+    def __init__(self, images):
+        # images: anahtar -> aynı boyuttaki blok görselleri
+        images = {key: image for key, image in images.items() if image}
+        width = sum(image.get_width() for image in images.values())
+        height = max((image.get_height() for image in images.values()), default=0)
+
+        self.regions = {}  # anahtar -> atlas içindeki kaynak dikdörtgen
+        self.surface = None
+        if not images:
+            return
+
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for key, image in images.items():
+            self.regions[key] = atlas.blit(image, (x, 0))
+            x += image.get_width()
+        self.surface, _ = convert_surface(atlas)
+
+    def get_region(self, key):
+        return self.regions.get(key)
+
+    def get_image(self, key):
+        """Bölgeyi atlası paylaşan bir alt yüzey olarak döndür"""
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        return self.surface.subsurface(region)
+
+class BlockSpriteCache:
+    """Görseli olmayan bloklar için önceden çizilmiş yuvarlak köşeli sprite'lar"""
+    def __init__(self):
+        self.sprites = {}
+
+    def get_label(self, block):
+        """Bloğun üzerinde yazacak metni döndür"""
+        if block.block_type == "multi_hit":
+            return str(block.hits_required - block.current_hits)
+        if block.block_type == "mystery" and (pygame.time.get_ticks() // 500) % 2:
+            return "?"
+        return None
+
+    def get_sprite(self, block):
+        border = block.block_type == "hard" and block.current_hits < block.hits_required
+        label = self.get_label(block)
+        key = (block.rect.width, block.rect.height, block.color, border, label)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.create_sprite(block.rect.size, block.color, border, label)
+            self.sprites[key] = sprite
+        return sprite
+
+    def create_sprite(self, size, color, border, label):
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, color, rect, border_radius=5)
+        if border:
+            pygame.draw.rect(sprite, (44, 62, 80), rect, 2, border_radius=5)
+        if label:
+            text = render_text(get_font(20), label, (255, 255, 255))
+            sprite.blit(text, text.get_rect(center=rect.center))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+# Tüm blokların paylaştığı sprite önbelleği
+block_sprites = BlockSpriteCache()
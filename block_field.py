@@ -0,0 +1,144 @@
+import numpy as np
+
+# Tür kimlikleri (type_id dizisindeki değerler)
+BLOCK_TYPES = ("normal", "hard", "explosive", "multi_hit", "power_up", "mystery", "indestructible", "moving")
+
+class BlockField:
+    """Blok verilerinin paralel NumPy dizilerinde tutulduğu depo.
+
+    Her blok bir yuvaya (slot) yerleşir; konum, boyut, vuruş, tür, puan ve
+    güçlendirme bilgisi dizilerde, canlılık alive maskesinde tutulur. Silme
+    yuvayı boşaltır (O(1)), toplu sorgular tüm canlı bloklar üzerinde tek
+    seferde yapılır. objects dizisi çizim ve seviye kodunun kullandığı
+    Block nesnelerine yuvadan ulaşmayı sağlar.
+    """
+    ARRAYS = ("x", "y", "w", "h", "hits", "hits_required", "type_id", "points", "powerup", "alive", "order")
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.w = np.zeros(capacity, dtype=np.int32)
+        self.h = np.zeros(capacity, dtype=np.int32)
+        self.hits = np.zeros(capacity, dtype=np.int32)
+        self.hits_required = np.zeros(capacity, dtype=np.float64)  # Kırılmaz bloklar için inf
+        self.type_id = np.zeros(capacity, dtype=np.int16)
+        self.points = np.zeros(capacity, dtype=np.int32)
+        self.powerup = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.order = np.zeros(capacity, dtype=np.int64)  # Oluşturulma sırası
+        self.objects = [None] * capacity  # yuva -> Block
+        self.free = []  # Boşalan yuvalar
+        self.size = 0  # Kullanılmış en yüksek yuva + 1
+        self.count = 0
+        self.type_ids = {name: i for i, name in enumerate(BLOCK_TYPES)}
+        self.live = None  # Canlı yuvalar (oluşturulma sırasıyla), değişince yeniden hesaplanır
+        self.view = None  # Canlı Block nesneleri
+
+    def __len__(self):
+        return self.count
+
+    def get_type_id(self, block_type):
+        if block_type not in self.type_ids:
+            self.type_ids[block_type] = len(self.type_ids)
+        return self.type_ids[block_type]
+
+    def grow(self):
+        """Kapasiteyi iki katına çıkar"""
+        capacity = self.capacity * 2
+        for name in self.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.objects.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def add(self, block):
+        """Bloğu boş bir yuvaya yerleştir ve yuvayı döndür"""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.size >= self.capacity:
+                self.grow()
+            slot = self.size
+            self.size += 1
+        self.x[slot] = block.rect.x
+        self.y[slot] = block.rect.y
+        self.w[slot] = block.rect.width
+        self.h[slot] = block.rect.height
+        self.hits[slot] = block.current_hits
+        self.hits_required[slot] = block.hits_required
+        self.type_id[slot] = self.get_type_id(block.block_type)
+        self.points[slot] = block.points
+        self.powerup[slot] = block.contains_powerup
+        self.order[slot] = block.order
+        self.alive[slot] = True
+        self.objects[slot] = block
+        block.field = self
+        block.slot = slot
+        self.count += 1
+        self.live = self.view = None
+        return slot
+
+    def remove(self, slot):
+        """Yuvayı boşalt (O(1))"""
+        block = self.objects[slot]
+        if block is None:
+            return
+        block.field = None
+        self.alive[slot] = False
+        self.objects[slot] = None
+        self.free.append(slot)
+        self.count -= 1
+        self.live = self.view = None
+
+    def contains(self, block):
+        return block.field is self and self.objects[block.slot] is block
+
+    def clear(self):
+        self.alive[:self.size] = False
+        for block in self.objects[:self.size]:
+            if block is not None:
+                block.field = None
+        self.objects = [None] * self.capacity
+        self.free.clear()
+        self.size = 0
+        self.count = 0
+        self.live = self.view = None
+
+    def move(self, block):
+        """Hareket eden bloğun konumunu dizilere yaz"""
+        self.x[block.slot] = block.rect.x
+        self.y[block.slot] = block.rect.y
+
+    def live_slots(self):
+        """Canlı yuvalar, blokların oluşturulma sırasıyla"""
+        if self.live is None:
+            slots = np.flatnonzero(self.alive[:self.size])
+            self.live = slots[np.argsort(self.order[slots], kind="stable")]
+        return self.live
+
+    def blocks(self):
+        """Canlı Block nesneleri (oluşturulma sırasıyla)"""
+        if self.view is None:
+            objects = self.objects
+            self.view = [objects[slot] for slot in self.live_slots().tolist()]
+        return self.view
+
+    def get_centers(self, slots):
+        """pygame.Rect.center ile aynı (tam sayı bölmeli) merkezler"""
+        return self.x[slots] + self.w[slots] // 2, self.y[slots] + self.h[slots] // 2
+
+    def find_overlaps(self, left, top, right, bottom, slots=None):
+        """Sorgu dikdörtgenleri x bloklar örtüşme matrisi ve blok yuvaları.
+
+        pygame.Rect.colliderect ile aynı kural. slots verilmezse tüm canlı
+        bloklar test edilir; sütunlar yuvaların verildiği sırada.
+        """
+        if slots is None:
+            slots = self.live_slots()
+        x, y = self.x[slots], self.y[slots]
+        hits = ((left[:, None] < x + self.w[slots]) & (right[:, None] > x) &
+                (top[:, None] < y + self.h[slots]) & (bottom[:, None] > y))
+        return hits, slots
@@ -0,0 +1,84 @@
+import numpy as np
+
+class BlockKinematics:
+    """Sadece hareketli blokları izleyen kinematik sistemi.
+
+    Başlangıç konumu, kayma, hız ve yön NumPy dizilerinde tutulur; tüm
+    bloklar tek vektörel adımda ilerletilir ve ±limit piksel sınırında yön
+    değiştirir. step sadece tam sayı konumu değişen blokları döndürür,
+    böylece ızgara ve çizim önbellekleri yalnızca gerçekten kayan bloklar
+    için güncellenir.
+    """
+    def __init__(self, limit=50):
+        self.limit = limit  # Başlangıç konumundan en fazla uzaklık
+        self.blocks = []
+        self.index = {}  # id(blok) -> dizi indeksi
+        self.origin = np.zeros(0, dtype=np.float64)
+        self.offset = np.zeros(0, dtype=np.float64)  # Başlangıçtan uzaklık (alt piksel)
+        self.speed = np.zeros(0, dtype=np.float64)
+        self.direction = np.zeros(0, dtype=np.float64)
+        self.x = np.zeros(0, dtype=np.int32)  # Bloğun rect.x değeri
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def add(self, block):
+        self.index[id(block)] = len(self.blocks)
+        self.blocks.append(block)
+        self.origin = np.append(self.origin, block.original_x)
+        self.offset = np.append(self.offset, block.move_offset)
+        self.speed = np.append(self.speed, block.move_speed)
+        self.direction = np.append(self.direction, block.move_direction)
+        self.x = np.append(self.x, np.int32(block.rect.x))
+
+    def remove(self, block):
+        """Bloğu son elemanla yer değiştirerek çıkar (O(1))"""
+        i = self.index.pop(id(block), None)
+        if i is None:
+            return
+        last = len(self.blocks) - 1
+        if i != last:
+            moved = self.blocks[last]
+            self.blocks[i] = moved
+            self.index[id(moved)] = i
+            for array in (self.origin, self.offset, self.speed, self.direction, self.x):
+                array[i] = array[last]
+        self.blocks.pop()
+        self.origin = self.origin[:last]
+        self.offset = self.offset[:last]
+        self.speed = self.speed[:last]
+        self.direction = self.direction[:last]
+        self.x = self.x[:last]
+
+    def clear(self):
+        self.blocks.clear()
+        self.index.clear()
+        for name in ("origin", "offset", "speed", "direction", "x"):
+            setattr(self, name, getattr(self, name)[:0])
+
+    def step(self, dt=1.0):
+        """Blokları ilerlet, konumu değişen blokları döndür"""
+        if not self.blocks:
+            return []
+        self.offset += self.speed * self.direction * dt
+        position = self.origin + self.offset
+
+        # pygame.Rect gibi en yakın tam sayıya, yarımlar sıfırdan uzağa
+        distance = np.abs(position)
+        whole = np.floor(distance)
+        whole += distance - whole >= 0.5
+        x = np.copysign(whole, position).astype(np.int32)
+
+        # Hareket sınırını aşanlar geri döner
+        self.direction[np.abs(self.offset) > self.limit] *= -1
+
+        changed = np.flatnonzero(x != self.x)
+        if len(changed) == 0:
+            return []
+        self.x[changed] = x[changed]
+        moved = []
+        for i, new_x in zip(changed.tolist(), x[changed].tolist()):
+            block = self.blocks[i]
+            block.rect.x = new_x
+            moved.append(block)
+        return moved
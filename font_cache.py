@@ -0,0 +1,62 @@
+import pygame
+from collections import OrderedDict
+
+class FontCache:
+    """Uygulama genelinde paylaşılan font kayıt defteri ve yazı yüzeyi önbelleği"""
+    def __init__(self, max_surfaces=512):
+        self.fonts = {}  # (font adı, boyut) -> pygame.font.Font
+        self.surfaces = OrderedDict()  # (font, yazı, renk, antialias) -> Surface
+        self.max_surfaces = max_surfaces
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size, name=None):
+        """Aynı font ve boyut için tek bir Font nesnesi döndür"""
+        key = (name, int(size))
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, int(size))
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """Yazıyı çiz ya da daha önce çizilmiş yüzeyi döndür (LRU)"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)  # En eski kullanılanı çıkar
+        return surface
+
+    def clear(self):
+        """Yazı önbelleğini temizle"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Önbellek istatistiklerini döndür"""
+        total = self.hits + self.misses
+        return {
+            "fonts": len(self.fonts),
+            "surfaces": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+# Tüm modüllerin kullandığı ortak önbellek
+font_cache = FontCache()
+
+def get_font(size, name=None):
+    return font_cache.get_font(size, name)
+
+def render_text(font, text, color, antialias=True):
+    return font_cache.render(font, text, color, antialias)
@@ -0,0 +1,97 @@
+from collections import deque
+from font_cache import get_font, render_text
+
+class FrameGovernor:
+    """Kare sürelerini izler, bütçe aşılınca pahalı görsel efektleri sırayla kapatır"""
+    # Her seviyede kapatılan efekt (seviyeler birikimlidir)
+    LEVELS = [
+        ("menu_glow", False),
+        ("pause_overlay_alpha", False),
+        ("particle_scale", 0.5),
+        ("particle_scale", 0.25)
+    ]
+    DEFAULT_QUALITY = {
+        "menu_glow": True,
+        "pause_overlay_alpha": True,
+        "particle_scale": 1.0
+    }
+
+    def __init__(self, target_fps=60, sample_window=60, degrade_threshold=1.0,
+                 restore_threshold=0.6, enabled=True, debug_overlay=False):
+        self.target_fps = target_fps  # Ana döngünün kare sınırı
+        self.budget_ms = 1000.0 / target_fps
+        self.frame_times = deque(maxlen=sample_window)
+        self.degrade_threshold = degrade_threshold  # Bütçenin bu katı aşılırsa kalite düşer
+        self.restore_threshold = restore_threshold  # Bütçenin bu katının altında kalite geri gelir
+        self.enabled = enabled
+        self.show_overlay = debug_overlay
+
+        self.level = 0
+        self.quality = dict(self.DEFAULT_QUALITY)
+        self.decisions = deque(maxlen=3)  # Son kararlar (debug ekranı için)
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """Eşikleri settings.json'daki performans ayarlarından oku"""
+        def get(name):
+            return settings_manager.get_setting("performance", name)
+        return cls(target_fps=get("target_fps"),
+                   sample_window=get("sample_window"),
+                   degrade_threshold=get("degrade_threshold"),
+                   restore_threshold=get("restore_threshold"),
+                   enabled=get("frame_governor"),
+                   debug_overlay=get("debug_overlay"))
+
+    def get_average(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def update(self, frame_ms):
+        """Kare süresini ekle; kalite seviyesi değiştiyse True döndür"""
+        self.frame_times.append(frame_ms)
+        if not self.enabled or len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        average = self.get_average()
+        if average > self.budget_ms * self.degrade_threshold and self.level < len(self.LEVELS):
+            self.set_level(self.level + 1, average)
+            return True
+        if average < self.budget_ms * self.restore_threshold and self.level > 0:
+            self.set_level(self.level - 1, average)
+            return True
+        return False
+
+    def set_level(self, level, average=0.0):
+        """Kalite seviyesini uygula ve ölçüm penceresini sıfırla"""
+        direction = "düşürüldü" if level > self.level else "artırıldı"
+        self.level = level
+        self.quality = dict(self.DEFAULT_QUALITY)
+        for name, value in self.LEVELS[:level]:
+            self.quality[name] = value
+        # Yeni seviyenin etkisi temiz bir pencereyle ölçülsün
+        self.frame_times.clear()
+
+        changed = self.LEVELS[level - 1] if direction == "düşürüldü" else self.LEVELS[level]
+        self.decisions.append(f"Kalite {direction}: {changed[0]}={self.quality[changed[0]]} ({average:.1f} ms)")
+
+    def get(self, name):
+        return self.quality[name]
+
+    def draw_overlay(self, screen):
+        """Seviye ve son kararları gösteren debug ekranını çiz, kapladığı alanı döndür"""
+        font = get_font(20)
+        lines = [f"Kare: {self.get_average():.1f} / {self.budget_ms:.1f} ms  Seviye: {self.level}/{len(self.LEVELS)}"]
+        lines += list(self.decisions)
+
+        texts = [render_text(font, line, (255, 255, 0)) for line in lines]
+        width = max(text.get_width() for text in texts) + 10
+        height = sum(text.get_height() for text in texts) + 10
+        x, y = 10, 40
+
+        area = screen.fill((0, 0, 0), (x, y, width, height))
+        y += 5
+        for text in texts:
+            screen.blit(text, (x + 5, y))
+            y += text.get_height()
+        return area
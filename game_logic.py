@@ -1,80 +1,100 @@
 import pygame
 from game_objects import Platform, Ball, BlockManager
 from power_up_system import PowerUpManager
-import os
-import math
+from physics import paddle_bounce, reflect, sweep_circle_rect, sweep_circle_walls
+from sound_bank import sound_bank
 
 class GameLogic:
+    """Fizik adımı ve oyun kuralları.
+
+    Fizik tarafı (move_ball, detect_collisions) sadece dünyayı günceller ve
+    adım başına bir çarpışma olayı listesi üretir; skor, ses, power-up,
+    combo ve parçacık gibi yan etkiler apply_events ile bu listeden toplu
+    uygulanır.
+    Olaylar {"type": ...} sözlükleridir:
+        ball_wall, ball_paddle, shield : {"count"} (sekilen top sayısı)
+        ball_block, laser_block        : {"block", "broken", "combo"}
+        explosion                      : {"block", "result"} (handle_explosive_block sonucu)
+        ball_lost                      : {}
+    """
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.combo = 0
         self.last_hit_time = 0
         self.combo_timeout = 2000  # 2 saniye
+        self.max_bounces = 4  # Bir karede çözülecek en fazla sekme
+        self.particles = None  # Kırılma ve patlama efektleri (olaylar uygulanırken üretilir)
         
-        # Ses efektleri
-        self.sounds = {}
+        # Ses efektleri (başlangıçta bir kez çözülür, olay adıyla çalınır)
+        self.sound_bank = sound_bank
         self.load_sounds()
         
+        # Seviyeye özel blok kırılma sesleri ("block_break" olayına bağlanır)
+        self.break_sound_paths = {
+            1: "Assests/tas/taş_blok_kırılma.mp3",
+            2: "Assests/col/cam_kırılma.mp3",
+            3: "Assests/buz/buzsesi.mp3"
+        }
+        self.sound_bank.preload(self.break_sound_paths.values())
+        self.sound_level = None  # "block_break" olayının bağlı olduğu seviye
+
     def load_sounds(self):
-        """Ses dosyalarını yükle"""
-        sound_files = {
+        """Ses dosyalarını olay adlarına bağla"""
+        # Çok toplu kombolarda üst üste binmesin diye sınırlı ve seyreltilmiş
+        self.sound_bank.bind_many({
             "hit": "Assests/topsesi.mp3",
             "score": "Assests/skorses.mp3"
-        }
-        
-        for name, path in sound_files.items():
-            try:
-                if os.path.exists(path):
-                    sound = pygame.mixer.Sound(path)
-                    sound.set_volume(0.5)  # Ses seviyesini ayarla
-                    self.sounds[name] = sound
-            except:
-                print(f"Ses dosyası yüklenemedi: {path}")
+        }, max_voices=3, interval=30)
         
     def play_sound(self, sound_name):
         """Ses çal"""
-        if sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except:
-                print(f"Ses çalınamadı: {sound_name}")
+        self.sound_bank.play(sound_name)
+
+    def play_break_sound(self, level):
+        """Seviyenin blok kırılma sesini çal"""
+        if level != self.sound_level:
+            self.sound_level = level
+            sound_path = self.break_sound_paths.get(level)
+            if sound_path:
+                self.sound_bank.bind("block_break", sound_path, priority=2, max_voices=3, interval=30)
+            else:
+                self.sound_bank.unbind("block_break")
+        self.sound_bank.play("block_break")
+
+    def update(self, ball, platform, block_manager, power_up_manager, game_state, dt=1.0):
+        """Bir simülasyon adımı: topu ilerlet, çarpışmaları bul, kuralları uygula"""
+        events = []
+        if ball.active:
+            self.move_ball(ball, platform, block_manager, dt, events)
+        self.detect_collisions(ball, platform, block_manager, power_up_manager, events)
+        self.apply_events(events, ball, platform, power_up_manager, game_state)
+        return events
                 
-    def check_collisions(self, ball, platform, block_manager, power_up_manager, game_state):
+    def detect_collisions(self, ball, platform, block_manager, power_up_manager, events=None):
+        """Örtüşme tabanlı çarpışmaları çöz, olayları events listesine ekle"""
+        if events is None:
+            events = []
+        
         # Can kaybı kontrolü
         if ball.y + ball.radius > self.screen_height:
-            game_state.lives -= 1
-            if game_state.lives <= 0:
-                game_state.change_state("game_over")
-                if "gameover" in self.sounds:
-                    self.sounds["gameover"].play()
-            else:
-                ball.reset()
-                platform.reset()
-                if "hit" in self.sounds:
-                    self.sounds["hit"].play()
-            return game_state.score
-
-        # Ekstra toplar için can kaybı kontrolü
-        if hasattr(power_up_manager, 'extra_balls'):
-            for extra_ball in power_up_manager.extra_balls[:]:
-                if extra_ball.y + extra_ball.radius > self.screen_height:
-                    power_up_manager.extra_balls.remove(extra_ball)
+            events.append({"type": "ball_lost"})
+            return events
 
         # Duvar çarpışmaları
         if ball.x - ball.radius <= 0:
             ball.x = ball.radius
             ball.dx = abs(ball.dx)
-            self.play_sound("hit")
+            events.append({"type": "ball_wall", "count": 1})
         elif ball.x + ball.radius >= self.screen_width:
             ball.x = self.screen_width - ball.radius
             ball.dx = -abs(ball.dx)
-            self.play_sound("hit")
+            events.append({"type": "ball_wall", "count": 1})
             
         if ball.y - ball.radius <= 0:
             ball.y = ball.radius
             ball.dy = abs(ball.dy)
-            self.play_sound("hit")
+            events.append({"type": "ball_wall", "count": 1})
             
         # Platform çarpışması
         platform_rect = platform.rect.inflate(-10, -5)  # Daha hassas çarpışma için
@@ -82,181 +102,232 @@ class GameLogic:
                               ball.radius * 2, ball.radius * 2)
                               
         if platform_rect.colliderect(ball_rect):
-            # Çarpışma noktasını hesapla
-            hit_point = (ball.x - platform.rect.x) / platform.rect.width
-            
-            # Gelen açıyı hesapla
-            incoming_angle = math.atan2(ball.dy, ball.dx)
+            self.bounce_off_platform(ball, platform)
+            events.append({"type": "ball_paddle", "count": 1})
             
-            # Yeni açıyı hesapla (platform pozisyonuna göre)
-            bounce_angle = math.pi * (0.25 + 0.5 * hit_point)  # 45° ile 135° arası
+        # Çoğalan toplar (tek seferde dizi işlemleriyle)
+        self.update_extra_balls(platform, block_manager, power_up_manager, events)
+        
+        # Kalkan kontrolü
+        if platform.has_shield and platform.shield_rect:
+            if ball.y + ball.radius >= platform.shield_rect.top:
+                ball.dy = -abs(ball.dy)  # Topu yukarı yönlendir
+                events.append({"type": "shield", "count": 1})
             
-            # Hızı koru
-            speed = math.sqrt(ball.dx * ball.dx + ball.dy * ball.dy)
+        # Blok çarpışmaları (sadece lazerin/topun değdiği ızgara hücreleri)
+        # Lazer çarpışması (tüm lazerler tek seferde, her bloğa adımda en fazla bir lazer)
+        if platform.has_laser:
+            destroyed = set()  # Aynı adımda patlamayla kırılan bloklar
+            for block in platform.lasers.find_block_hits(block_manager):
+                if id(block) in destroyed:
+                    continue
+                broken = bool(block.hit())
+                events.append({"type": "laser_block", "block": block, "broken": broken, "combo": False})
+                if broken:
+                    destroyed.update(id(b) for b in self.destroy_block(block, block_manager, events))
+                else:
+                    block_manager.mark_damaged(block)
+        
+        # Top çarpışması
+        ball_rect = pygame.Rect(ball.x - ball.radius, ball.y - ball.radius,
+                              ball.radius * 2, ball.radius * 2)
+        block = block_manager.find_collision(ball_rect)
+        if block:
+            # Çarpışma yönünü belirle
+            dx = ball.x - block.rect.centerx
+            dy = ball.y - block.rect.centery
             
-            # Yapışkan platform kontrolü
-            if platform.sticky:
-                ball.attach_to_platform(platform)
+            if abs(dx/block.rect.width) > abs(dy/block.rect.height):
+                ball.dx = abs(ball.dx) if dx > 0 else -abs(ball.dx)
             else:
-                # Yeni hız vektörlerini hesapla
-                ball.dx = speed * math.cos(bounce_angle)
-                ball.dy = -abs(speed * math.sin(bounce_angle))  # Yukarı yönlendir
-                
-                # Topun platformun içine girmesini önle
-                ball.y = platform.rect.y - ball.radius
-            
-            self.play_sound("hit")
+                ball.dy = abs(ball.dy) if dy > 0 else -abs(ball.dy)
             
-        # Çoğalan top güncellemesi
-        if hasattr(power_up_manager, 'extra_balls'):
-            for extra_ball in power_up_manager.extra_balls:
-                # Duvar çarpışmaları
-                if extra_ball.x - extra_ball.radius <= 0:
-                    extra_ball.x = extra_ball.radius
-                    extra_ball.dx = abs(extra_ball.dx)
-                elif extra_ball.x + extra_ball.radius >= self.screen_width:
-                    extra_ball.x = self.screen_width - extra_ball.radius
-                    extra_ball.dx = -abs(extra_ball.dx)
-                    
-                if extra_ball.y - extra_ball.radius <= 0:
-                    extra_ball.y = extra_ball.radius
-                    extra_ball.dy = abs(extra_ball.dy)
-                
-                # Platform çarpışması
-                extra_ball_rect = pygame.Rect(extra_ball.x - extra_ball.radius, 
-                                           extra_ball.y - extra_ball.radius,
-                                           extra_ball.radius * 2, extra_ball.radius * 2)
+            # Bloğu vur
+            self.ball_hit_block(ball, block, block_manager, events)
                 
-                if platform_rect.colliderect(extra_ball_rect):
-                    # Çarpışma noktasını hesapla
-                    hit_point = (extra_ball.x - platform.rect.x) / platform.rect.width
-                    
-                    # Gelen açıyı hesapla
-                    incoming_angle = math.atan2(extra_ball.dy, extra_ball.dx)
-                    
-                    # Yeni açıyı hesapla
-                    bounce_angle = math.pi * (0.25 + 0.5 * hit_point)
-                    
-                    # Hızı koru
-                    speed = math.sqrt(extra_ball.dx * extra_ball.dx + extra_ball.dy * extra_ball.dy)
-                    
-                    if platform.sticky:
-                        extra_ball.attach_to_platform(platform)
-                    else:
-                        extra_ball.dx = speed * math.cos(bounce_angle)
-                        extra_ball.dy = -abs(speed * math.sin(bounce_angle))
-                        extra_ball.y = platform.rect.y - extra_ball.radius
-                        
-                # Blok çarpışmaları
-                for block in block_manager.blocks[:]:
-                    if extra_ball_rect.colliderect(block.rect):
-                        # Çarpışma yönünü belirle
-                        dx = extra_ball.x - block.rect.centerx
-                        dy = extra_ball.y - block.rect.centery
-                        
-                        if abs(dx/block.rect.width) > abs(dy/block.rect.height):
-                            extra_ball.dx = abs(extra_ball.dx) if dx > 0 else -abs(extra_ball.dx)
-                        else:
-                            extra_ball.dy = abs(extra_ball.dy) if dy > 0 else -abs(extra_ball.dy)
-                        
-                        if block.hit():
-                            if block.contains_powerup:
-                                power_up_manager.spawn_powerup(
-                                    block.rect.centerx,
-                                    block.rect.centery
-                                )
-                            block_manager.blocks.remove(block)
-                            game_state.score += block.points
-                            self.play_sound("score")
-                        break
+        return events
+
+    def apply_events(self, events, ball, platform, power_up_manager, game_state):
+        """Adımın çarpışma olaylarından skor, ses, power-up, combo ve parçacık etkilerini toplu uygula"""
+        current_time = pygame.time.get_ticks()
+        score = 0
+        spawns = []
+        breaks = {}  # renk -> kırılan blokların merkezleri
+        blasts = []  # Patlayan blokların merkezleri
+        sounds = set()  # Aynı ses bir adımda bir kez çalınır
+        break_sound = False
         
-        # Kalkan kontrolü
-        if platform.has_shield and platform.shield_rect:
-            if ball.y + ball.radius >= platform.shield_rect.top:
-                ball.dy = -abs(ball.dy)  # Topu yukarı yönlendir
-                self.play_sound("hit")
+        for event in events:
+            event_type = event["type"]
+            if event_type in ("ball_wall", "ball_paddle", "shield"):
+                sounds.add("hit")
             
-            # Ekstra toplar için kalkan kontrolü
-            if hasattr(power_up_manager, 'extra_balls'):
-                for extra_ball in power_up_manager.extra_balls:
-                    if extra_ball.y + extra_ball.radius >= platform.shield_rect.top:
-                        extra_ball.dy = -abs(extra_ball.dy)  # Ekstra topu yukarı yönlendir
-                        self.play_sound("hit")
+            elif event_type in ("ball_block", "laser_block"):
+                if not event["broken"]:
+                    continue
+                block = event["block"]
+                breaks.setdefault(block.color, []).append(block.rect.center)
+                if block.contains_powerup:
+                    spawns.append(block.rect.center)
+                if event["combo"]:
+                    # Ana topla kırılan bloklar combo'yu artırır
+                    if current_time - self.last_hit_time > self.combo_timeout:
+                        self.combo = 0
+                    score += block.points * (1 + self.combo * 0.1)
+                    self.combo += 1
+                    self.last_hit_time = current_time
+                    break_sound = True
+                else:
+                    score += block.points
+                sounds.add("score")
             
-        # Blok çarpışmaları
-        blocks_to_remove = []
-        for block in block_manager.blocks:
-            # Lazer çarpışması
-            if platform.has_laser:
-                for laser in platform.lasers[:]:
-                    if laser["rect"].colliderect(block.rect):
-                        platform.lasers.remove(laser)
-                        if block.hit():
-                            if block.contains_powerup:
-                                power_up_manager.spawn_powerup(
-                                    block.rect.centerx,
-                                    block.rect.centery
-                                )
-                            blocks_to_remove.append(block)
-                            game_state.score += block.points
-                            self.play_sound("score")
-                        break
+            elif event_type == "explosion":
+                score += event["result"]["points"]
+                spawns.extend(event["result"]["power_ups"])
+                blasts.extend(event["result"]["centers"])
+                for block in event["result"]["destroyed"]:
+                    breaks.setdefault(block.color, []).append(block.rect.center)
             
-            # Top çarpışması
-            ball_rect = pygame.Rect(ball.x - ball.radius, ball.y - ball.radius,
-                                  ball.radius * 2, ball.radius * 2)
+            elif event_type == "ball_lost":
+                game_state.lives -= 1
+                if game_state.lives <= 0:
+                    game_state.change_state("game_over")
+                    self.play_sound("gameover")
+                else:
+                    ball.reset()
+                    platform.reset()
+                    sounds.add("hit")
+        
+        if score:
+            game_state.score += score
+        for x, y in spawns:
+            power_up_manager.spawn_powerup(x, y)
+        if break_sound:
+            self.play_break_sound(game_state.level)
+        if self.particles:
+            for color, points in breaks.items():
+                self.particles.emit_many(points, color)
+            if blasts:
+                self.particles.emit_many(blasts, (243, 156, 18), amount=60, speed=6.0, life=40)
+        for sound_name in sounds:
+            self.play_sound(sound_name)
+        
+    def bounce_off_platform(self, ball, platform):
+        """Topu platformdaki çarpışma noktasına göre yukarı sektir"""
+        # Yapışkan platform kontrolü
+        if platform.sticky:
+            ball.attach_to_platform(platform)
+        else:
+            # Ekstra toplarla aynı açı kuralı
+            dx, dy = paddle_bounce(ball.x, ball.dx, ball.dy, platform.rect)
+            ball.dx, ball.dy = float(dx), float(dy)
             
-            if ball_rect.colliderect(block.rect):
-                # Çarpışma yönünü belirle
-                dx = ball.x - block.rect.centerx
-                dy = ball.y - block.rect.centery
+            # Topun platformun içine girmesini önle
+            ball.y = platform.rect.y - ball.radius
+        
+    def update_extra_balls(self, platform, block_manager, power_up_manager, events):
+        """Ekstra topların duvar, platform, kalkan ve blok çarpışmaları"""
+        balls = power_up_manager.extra_balls
+        shield_top = platform.shield_rect.top if platform.has_shield and platform.shield_rect else None
+        shielded = balls.collide_bounds(self.screen_width, self.screen_height, platform, shield_top)
+        if shielded:
+            events.append({"type": "shield", "count": shielded})
+
+        # Aynı adımda kırılan bloğa ikinci top vurmasın
+        destroyed = set()
+        for index, block in balls.find_block_hits(block_manager):
+            if id(block) in destroyed:
+                continue
+            balls.bounce_off_block(index, block)
+            broken = bool(block.hit())
+            events.append({"type": "ball_block", "block": block, "broken": broken, "combo": False})
+            if broken:
+                destroyed.add(id(block))
+                destroyed.update(id(b) for b in self.destroy_block(block, block_manager, events))
+            else:
+                block_manager.mark_damaged(block)
+
+    def destroy_block(self, block, block_manager, events):
+        """Kırılan bloğu kaldır; patlayıcıysa zincirleme patlamayı çöz.
+        
+        Patlamada kırılan ek blokları döndürür.
+        """
+        block_manager.remove_block(block)
+        if block.block_type != "explosive":
+            return []
+        result = block_manager.handle_explosive_block(block)
+        events.append({"type": "explosion", "block": block, "result": result})
+        return result["destroyed"]
+        
+    def ball_hit_block(self, ball, block, block_manager, events):
+        """Ana topun bloğa vuruşunu uygula, blok kırıldıysa True döndür"""
+        broken = bool(ball.strong or block.hit())
+        events.append({"type": "ball_block", "block": block, "broken": broken, "combo": True})
+        if broken:
+            self.destroy_block(block, block_manager, events)
+        else:
+            block_manager.mark_damaged(block)
+        return broken
                 
-                if abs(dx/block.rect.width) > abs(dy/block.rect.height):
-                    ball.dx = abs(ball.dx) if dx > 0 else -abs(ball.dx)
-                else:
-                    ball.dy = abs(ball.dy) if dy > 0 else -abs(ball.dy)
+    def move_ball(self, ball, platform, block_manager, dt=1.0, events=None):
+        """Topu hız vektörü boyunca sürekli (swept) çarpışma ile ilerlet.
+        
+        Duvar, platform ve bloklar arasından en erken temas bulunur, top temas
+        noktasına taşınıp normale göre sektirilir ve kalan hareketle devam edilir.
+        Her temas {"target", "normal", "time"} sözlüğü olarak döndürülür;
+        çarpışma olayları events listesine eklenir.
+        """
+        if events is None:
+            events = []
+        contacts = []
+        remaining = dt
+        platform_rect = platform.rect.inflate(-10, -5)  # Örtüşme kontrolüyle aynı alan
+        
+        while ball.active and remaining > 0 and len(contacts) < self.max_bounces:
+            dx, dy = ball.dx * remaining, ball.dy * remaining
+            radius = ball.radius
+            
+            # En erken teması bul
+            hit = sweep_circle_walls(ball.x, ball.y, dx, dy, radius, self.screen_width)
+            target = "wall"
+            
+            platform_hit = sweep_circle_rect(ball.x, ball.y, dx, dy, radius, platform_rect)
+            if platform_hit and (hit is None or platform_hit[0] < hit[0]):
+                hit, target = platform_hit, platform
                 
-                # Bloğu vur
-                if ball.strong or block.hit():
-                    # Blok kırılma sesi
-                    if game_state.level in [1, 2, 3]:
-                        sound_paths = {
-                            1: "Assests/tas/taş_blok_kırılma.mp3",
-                            2: "Assests/col/cam_kırılma.mp3",
-                            3: "Assests/buz/buzsesi.mp3"
-                        }
-                        sound_path = sound_paths[game_state.level]
-                        try:
-                            if os.path.exists(sound_path):
-                                sound = pygame.mixer.Sound(sound_path)
-                                sound.set_volume(0.5)
-                                sound.play()
-                        except:
-                            print(f"Blok kırılma sesi çalınamadı: {sound_path}")
-                            
-                    if block.contains_powerup:
-                        power_up_manager.spawn_powerup(
-                            block.rect.centerx,
-                            block.rect.centery
-                        )
-                    blocks_to_remove.append(block)
-                    game_state.score += block.points * (1 + self.combo * 0.1)
-                    self.combo += 1
-                    self.play_sound("score")
+            swept_rect = pygame.Rect(min(ball.x, ball.x + dx) - radius, min(ball.y, ball.y + dy) - radius,
+                                     abs(dx) + radius * 2 + 1, abs(dy) + radius * 2 + 1)
+            for block in block_manager.query(swept_rect):
+                block_hit = sweep_circle_rect(ball.x, ball.y, dx, dy, radius, block.rect)
+                if block_hit and (hit is None or block_hit[0] < hit[0]):
+                    hit, target = block_hit, block
+                    
+            if hit is None:
+                ball.x += dx
+                ball.y += dy
                 break
                 
-        # Blokları kaldır ve skoru güncelle
-        for block in blocks_to_remove:
-            if block in block_manager.blocks:
-                block_manager.blocks.remove(block)
-                
-        # Combo süresini kontrol et
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_hit_time > self.combo_timeout:
-            self.combo = 0
-        self.last_hit_time = current_time
-        
-        return game_state.score
+            # Temas noktasına ilerle (yüzeyden çok az uzakta kal)
+            t, normal = hit
+            ball.x += dx * t + normal[0] * 0.01
+            ball.y += dy * t + normal[1] * 0.01
+            remaining *= 1 - t
+            contacts.append({"target": target, "normal": normal, "time": dt - remaining})
+            
+            if target is platform and normal == (0, -1):
+                self.bounce_off_platform(ball, platform)
+                events.append({"type": "ball_paddle", "count": 1})
+            else:
+                ball.dx, ball.dy = reflect(ball.dx, ball.dy, normal)
+                if target == "wall":
+                    events.append({"type": "ball_wall", "count": 1})
+                elif target is platform:
+                    events.append({"type": "ball_paddle", "count": 1})
+                else:
+                    self.ball_hit_block(ball, target, block_manager, events)
+                    
+        ball.rect.center = (ball.x, ball.y)
+        return contacts
         
     def update_score(self, points, game_state):
         game_state.score += points
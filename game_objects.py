@@ -1,6 +1,11 @@
 import pygame
 import math
 import random
+import numpy as np
+from block_atlas import block_sprites
+from laser_system import LaserPool
+from block_field import BlockField
+from block_kinematics import BlockKinematics
 
 class Platform:
     def __init__(self, screen_width, screen_height):
@@ -22,8 +27,9 @@ class Platform:
         self.has_laser = False  # Lazer power-up'ı için
         self.has_shield = False  # Kalkan power-up'ı için
         self.laser_cooldown = 500  # Lazer atış hızı (ms)
+        self.original_laser_cooldown = self.laser_cooldown
         self.last_laser_time = 0
-        self.lasers = []  # Aktif lazerler
+        self.lasers = LaserPool()  # Aktif lazerler
         self.laser_damage = 0  # Lazer hasarı
         self.shield_height = 10  # Kalkan yüksekliği
         self.shield_rect = None  # Kalkan rect'i
@@ -46,30 +52,22 @@ class Platform:
         if image:
             self.sticky_image = pygame.transform.scale(image, (self.width, self.height))
             
-    def move(self, direction, screen_width):
+    def move(self, direction, screen_width, dt=1.0):
         if direction == "left":
-            self.x = max(0, self.x - self.speed)
+            self.x = max(0, self.x - self.speed * dt)
         elif direction == "right":
-            self.x = min(screen_width - self.width, self.x + self.speed)
+            self.x = min(screen_width - self.width, self.x + self.speed * dt)
         self.rect.x = self.x
         
     def shoot_laser(self):
         current_time = pygame.time.get_ticks()
         if self.has_laser and current_time - self.last_laser_time > self.laser_cooldown:
-            laser = {
-                "rect": pygame.Rect(self.rect.centerx - 2, self.rect.top, 4, 10),
-                "color": (231, 76, 60)  # Kırmızı
-            }
-            self.lasers.append(laser)
+            self.lasers.fire(self.rect.centerx - 2, self.rect.top)
             self.last_laser_time = current_time
             
-    def update_lasers(self):
-        # Lazerleri yukarı hareket ettir
-        laser_speed = 10
-        for laser in self.lasers[:]:
-            laser["rect"].y -= laser_speed
-            if laser["rect"].bottom < 0:
-                self.lasers.remove(laser)
+    def update_lasers(self, dt=1.0):
+        # Lazerleri yukarı hareket ettir, ekrandan çıkanları at
+        self.lasers.update(dt)
         
     def draw(self, screen):
         # Platform görselini çiz
@@ -93,9 +91,18 @@ class Platform:
             pygame.draw.rect(screen, (231, 76, 60), laser_indicator)
         
         # Aktif lazerleri çiz
-        for laser in self.lasers:
-            pygame.draw.rect(screen, laser["color"], laser["rect"])
+        self.lasers.draw(screen)
             
+    def get_draw_rects(self):
+        """Platformun ekranda kapladığı alanları döndür"""
+        rects = [self.rect.copy()]
+        if self.has_shield and self.shield_rect:
+            rects.append(pygame.Rect(0, self.rect.bottom + 20, self.screen_width, self.shield_height))
+        if self.has_laser:
+            rects.append(pygame.Rect(self.rect.centerx - 3, self.rect.top - 5, 6, 5))
+        rects.extend(self.lasers.get_draw_rects())
+        return rects
+        
     def reset(self):
         self.x = self.screen_width // 2 - self.width // 2
         self.y = self.screen_height - 40
@@ -104,6 +111,7 @@ class Platform:
         self.sticky = False
         self.has_laser = False
         self.has_shield = False
+        self.laser_cooldown = self.original_laser_cooldown
         self.lasers.clear()
         # Görseli orijinal haline getir
         if self.original_image:
@@ -136,10 +144,10 @@ class Ball:
         self.active = False  # Top harekette mi?
         self.strong = False  # Güçlü top power-up'ı
         
-    def move(self):
+    def move(self, dt=1.0):
         if self.active:
-            self.x += self.dx
-            self.y += self.dy
+            self.x += self.dx * dt
+            self.y += self.dy * dt
             self.rect.center = (self.x, self.y)
             
     def draw(self, screen):
@@ -148,6 +156,11 @@ class Ball:
             pygame.draw.circle(screen, (241, 196, 15), 
                              (int(self.x), int(self.y)), self.radius - 2)
             
+    def get_draw_rects(self):
+        """Topun ekranda kapladığı alanı döndür"""
+        size = int(self.radius) + 1
+        return [pygame.Rect(int(self.x) - size, int(self.y) - size, size * 2, size * 2)]
+            
     def attach_to_platform(self, platform):
         """Topu platforma yapıştır"""
         self.x = platform.x + platform.width // 2
@@ -193,15 +206,26 @@ class Block:
         self.contains_powerup = False
         self.points = self.get_points()
         
-        # Hareket özellikleri
+        # Hareketin başlangıç değerleri (hareket BlockKinematics dizilerinde ilerletilir)
         self.moving = block_type == "moving"
         self.move_speed = 2
         self.move_direction = 1
+        self.move_offset = 0  # Başlangıç konumundan uzaklık (alt piksel)
         
         # Görsel özellikler
         self.color = (52, 152, 219)  # Mavi
         self.image = None  # Blok görseli
         self.double_hit_image = None  # İki vuruşluk blok görseli
+        self.atlas = None  # Görselin bulunduğu tema atlası yüzeyi
+        self.atlas_area = None  # Görselin atlas içindeki bölgesi
+        
+        # Uzamsal ızgara bilgileri
+        self.order = 0  # Blok listesindeki oluşturulma sırası
+        self.grid_cells = ()  # Bloğun kayıtlı olduğu ızgara hücreleri
+        
+        # Dizi deposundaki yer (BlockField.add ile atanır)
+        self.field = None
+        self.slot = None
         
     def get_points(self):
         points = {
@@ -218,6 +242,8 @@ class Block:
         
     def hit(self):
         self.current_hits += 1
+        if self.field is not None:
+            self.field.hits[self.slot] = self.current_hits
         # Renk değişimi efekti
         self.color = tuple(min(c + 30, 255) for c in self.color)
         
@@ -229,43 +255,40 @@ class Block:
             
         return self.current_hits >= self.hits_required
         
-    def update(self):
-        if self.moving:
-            # Blok hareketini güncelle
-            self.rect.x += self.move_speed * self.move_direction
-            
-            # Hareket sınırlarını kontrol et
-            if abs(self.rect.x - self.original_x) > 50:  # 50 piksel hareket sınırı
-                self.move_direction *= -1
+    def get_blit(self):
+        """Surface.blits için (kaynak, hedef[, alan]) üçlüsünü döndür"""
+        if self.image:
+            if self.atlas is not None:
+                return (self.atlas, self.rect, self.atlas_area)
+            return (self.image, self.rect)
+        # Görsel yoksa önceden çizilmiş renkli sprite kullan
+        return (block_sprites.get_sprite(self), self.rect)
         
     def draw(self, screen):
-        if self.image:
-            screen.blit(self.image, self.rect)
-        else:
-            pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
-            
-            if self.block_type == "hard" and self.current_hits < self.hits_required:
-                pygame.draw.rect(screen, (44, 62, 80), self.rect, 2, border_radius=5)
-                
-            elif self.block_type == "multi_hit":
-                hits_left = self.hits_required - self.current_hits
-                text = pygame.font.Font(None, 20).render(str(hits_left), True, (255, 255, 255))
-                text_rect = text.get_rect(center=self.rect.center)
-                screen.blit(text, text_rect)
-                
-            elif self.block_type == "mystery":
-                if (pygame.time.get_ticks() // 500) % 2:
-                    text = pygame.font.Font(None, 20).render("?", True, (255, 255, 255))
-                    text_rect = text.get_rect(center=self.rect.center)
-                    screen.blit(text, text_rect)
+        screen.blit(*self.get_blit())
 
 class BlockManager:
     def __init__(self, screen_width):
         self.screen_width = screen_width
-        self.blocks = []
+        self.field = BlockField()  # Blok verileri paralel dizilerde
+        self.kinematics = BlockKinematics()  # Sadece hareketli bloklar
         self.block_width = 60
         self.block_height = 20
         self.padding = 5
+        self.damaged_rects = []  # Statik katmanda yeniden çizilmesi gereken alanlar
+        self.layout_version = 0  # Blok düzeni tamamen değiştiğinde artar
+        
+        # Uzamsal ızgara: hücre (sütun, satır) -> o hücreye değen bloklar
+        self.cell_width = self.block_width + self.padding
+        self.cell_height = self.block_height + self.padding
+        self.grid = {}
+        self.next_order = 0
+        self.explosion_radius = 100  # Patlayıcı blokların etki yarıçapı (merkezden merkeze)
+        
+        # Satır ve tür indeksleri: satır (rect.y) -> {id: blok}, tür -> adet
+        self.rows = {}
+        self.type_counts = {}
+        self.destructible_count = 0  # Kırılabilir (indestructible olmayan) blok sayısı
         
     def create_block(self, x, y, block_type, powerup_chance):
         # Blok türüne göre renk ve vuruş sayısı belirle
@@ -298,28 +321,248 @@ class BlockManager:
         if block_type != "indestructible" and random.random() < powerup_chance:
             block.contains_powerup = True
             
-        self.blocks.append(block)
+        block.order = self.next_order
+        self.next_order += 1
+        
+        self.field.add(block)
+        if block.moving:
+            self.kinematics.add(block)
+        self.add_to_grid(block)
+        self.add_to_index(block)
+        self.mark_damaged(block)
         
-    def update(self):
-        for block in self.blocks:
-            block.update()
+    def clear(self):
+        """Tüm blokları kaldır (yeni seviye düzeni için)"""
+        self.field.clear()
+        self.kinematics.clear()
+        self.grid.clear()
+        self.rows.clear()
+        self.type_counts.clear()
+        self.destructible_count = 0
+        self.damaged_rects.clear()
+        self.layout_version += 1
+        
+    def get_cells(self, rect):
+        """Dikdörtgenin değdiği ızgara hücrelerini döndür"""
+        first_col = rect.left // self.cell_width
+        last_col = (rect.right - 1) // self.cell_width
+        first_row = rect.top // self.cell_height
+        last_row = (rect.bottom - 1) // self.cell_height
+        return tuple((col, row) for col in range(first_col, last_col + 1)
+                     for row in range(first_row, last_row + 1))
+        
+    def add_to_grid(self, block):
+        block.grid_cells = self.get_cells(block.rect)
+        for cell in block.grid_cells:
+            self.grid.setdefault(cell, []).append(block)
+            
+    def remove_from_grid(self, block):
+        for cell in block.grid_cells:
+            cell_blocks = self.grid.get(cell)
+            if cell_blocks and block in cell_blocks:
+                cell_blocks.remove(block)
+                if not cell_blocks:
+                    del self.grid[cell]
+        block.grid_cells = ()
+        
+    def update_grid(self, block):
+        """Hareket eden bloğun hücreleri değiştiyse ızgarayı güncelle"""
+        cells = self.get_cells(block.rect)
+        if cells != block.grid_cells:
+            self.remove_from_grid(block)
+            self.add_to_grid(block)
+            return True
+        return False
+            
+    def add_to_index(self, block):
+        self.rows.setdefault(block.rect.y, {})[id(block)] = block
+        self.type_counts[block.block_type] = self.type_counts.get(block.block_type, 0) + 1
+        if block.block_type != "indestructible":
+            self.destructible_count += 1
+            
+    def remove_from_index(self, block):
+        row = self.rows.get(block.rect.y)
+        if row is None or row.pop(id(block), None) is None:
+            return
+        if not row:
+            del self.rows[block.rect.y]
+        self.type_counts[block.block_type] -= 1
+        if block.block_type != "indestructible":
+            self.destructible_count -= 1
+            
+    @property
+    def blocks(self):
+        """Canlı bloklar oluşturulma sırasıyla (çizim ve seviye kodu için)"""
+        return self.field.blocks()
+        
+    def contains(self, block):
+        """Blok hala oyunda mı (yuvasından, listeyi taramadan)"""
+        return self.field.contains(block)
+        
+    def get_row(self, y):
+        """Üst kenarı y olan satırdaki bloklar"""
+        return list(self.rows.get(y, {}).values())
+        
+    def count_type(self, block_type):
+        """Verilen türden kalan blok sayısı"""
+        return self.type_counts.get(block_type, 0)
+        
+    def query(self, rect):
+        """Dikdörtgenin değdiği hücrelerdeki blokları liste sırasıyla döndür"""
+        return self.query_cells(self.get_cells(rect))
+        
+    def query_cells(self, cells):
+        """Verilen hücrelerdeki blokları liste sırasıyla döndür"""
+        found = {}
+        for cell in cells:
+            for block in self.grid.get(cell, ()):
+                found[block.order] = block
+        return [found[order] for order in sorted(found)]
+        
+    def get_cells_many(self, left, top, right, bottom):
+        """Dikdörtgenlerin (NumPy dizileri) değdiği ızgara hücrelerinin kümesi"""
+        cell_width, cell_height = self.cell_width, self.cell_height
+        if len(left) <= 16:
+            # Az dikdörtgende düz döngü dizi işlemlerinin sabit maliyetinden ucuz
+            cells = set()
+            for l, t, r, b in zip(left.tolist(), top.tolist(), right.tolist(), bottom.tolist()):
+                if r <= l or b <= t:
+                    continue
+                for col in range(int(l // cell_width), int((r - 1) // cell_width) + 1):
+                    for row in range(int(t // cell_height), int((b - 1) // cell_height) + 1):
+                        cells.add((col, row))
+            return cells
+
+        first_col = (left // cell_width).astype(np.int64)
+        last_col = ((right - 1) // cell_width).astype(np.int64)
+        first_row = (top // cell_height).astype(np.int64)
+        last_row = ((bottom - 1) // cell_height).astype(np.int64)
+        valid = (right > left) & (bottom > top)  # Boş dikdörtgenler hücreye değmez
+        if not valid.all():
+            first_col, last_col = first_col[valid], last_col[valid]
+            first_row, last_row = first_row[valid], last_row[valid]
+        if len(first_col) == 0:
+            return set()
+
+        # Her dikdörtgenin hücreleri: en geniş dikdörtgen kadar kaydırılıp son hücresinde kırpılır,
+        # (sütun, satır) çiftleri tek tam sayıya kodlanıp tekrarlar atılır
+        span_x = int((last_col - first_col).max()) + 1
+        span_y = int((last_row - first_row).max()) + 1
+        cols = np.minimum(first_col[:, None] + np.arange(span_x), last_col[:, None])
+        rows = np.minimum(first_row[:, None] + np.arange(span_y), last_row[:, None])
+        base = 1 << 20
+        keys = np.unique(cols[:, :, None] * base + rows[:, None, :] + base // 2)
+        cols, rows = np.divmod(keys, base)
+        return set(zip(cols.tolist(), (rows - base // 2).tolist()))
+        
+    def query_slots(self, left, top, right, bottom):
+        """Dikdörtgenlerin değdiği hücrelerdeki blokların yuvaları (oluşturulma sırasıyla).
+
+        Toplu örtüşme testi sadece bu aday yuvalar üzerinde yapılır.
+        """
+        found = {}
+        for cell in self.get_cells_many(left, top, right, bottom):
+            for block in self.grid.get(cell, ()):
+                found[block.order] = block.slot
+        return np.array([found[order] for order in sorted(found)], dtype=np.intp)
+        
+    def find_collision(self, rect, exclude=()):
+        """Dikdörtgenle çarpışan ilk bloğu döndür (yoksa None)"""
+        for block in self.query(rect):
+            if block not in exclude and rect.colliderect(block.rect):
+                return block
+        return None
+        
+    def mark_damaged(self, block):
+        """Bloğun görünümü değişti, alanını yeniden çizilecekler listesine ekle"""
+        self.damaged_rects.append(block.rect.copy())
+        
+    def remove_block(self, block):
+        """Bloğu kaldır ve alanını hasarlı olarak işaretle"""
+        if self.contains(block):
+            self.field.remove(block.slot)
+            if block.moving:
+                self.kinematics.remove(block)
+            self.remove_from_grid(block)
+            self.remove_from_index(block)
+            self.mark_damaged(block)
+        
+    def remove_blocks(self, blocks):
+        """Birden çok bloğu tek geçişte kaldır"""
+        for block in blocks:
+            if not self.contains(block):
+                continue
+            self.field.remove(block.slot)
+            if block.moving:
+                self.kinematics.remove(block)
+            self.remove_from_grid(block)
+            self.remove_from_index(block)
+            self.mark_damaged(block)
+        
+    def update(self, dt=1.0):
+        """Hareketli blokları ilerlet; konumu değişen blokları döndür"""
+        moved = self.kinematics.step(dt)
+        for block in moved:
+            self.field.move(block)
+            self.update_grid(block)
+        return moved
             
     def handle_explosive_block(self, exploded_block):
-        # Patlayan bloğun etrafındaki blokları yok et
-        explosion_radius = 100
-        blocks_to_remove = []
-        
-        for block in self.blocks:
-            if block != exploded_block:
-                distance = math.sqrt(
-                    (block.rect.centerx - exploded_block.rect.centerx) ** 2 +
-                    (block.rect.centery - exploded_block.rect.centery) ** 2
-                )
-                if distance <= explosion_radius:
-                    blocks_to_remove.append(block)
-                    
-        for block in blocks_to_remove:
-            self.blocks.remove(block)
+        """Patlamayı zincirleme çöz ve toplu sonucu döndür.
+        
+        Her patlayıcının merkezine explosion_radius uzaklıktaki bloklar tek
+        seferde bir tabloya çıkarılır; patlama bu tablo üzerinde dalga dalga
+        (genişlik öncelikli) ilerler, her dalgada kırılan patlayıcılar sonraki
+        dalgayı oluşturur. Kırılan bloklar tek seferde kaldırılır; sonuç
+        {"destroyed", "points", "power_ups", "explosions", "centers"}
+        sözlüğüdür (centers: patlayan blokların merkezleri, efektler için).
+        Tetikleyen blok sonuca dahil edilmez.
+        """
+        field = self.field
+        slots = field.live_slots()
+        objects = field.objects
+        center_x, center_y = (center.astype(np.float32) for center in field.get_centers(slots))
+        explosive = np.flatnonzero(field.type_id[slots] == field.type_ids["explosive"])
+        radius_sq = self.explosion_radius * self.explosion_radius
+        
+        # Patlayıcı blokların alanına giren bloklar (patlayıcı x blok tablosu)
+        dx = center_x - center_x[explosive, None]
+        dy = center_y - center_y[explosive, None]
+        reach = dx * dx + dy * dy <= radius_sq
+        
+        # Kırılan bloklar (tetikleyen blok hala depodaysa baştan işaretli)
+        visited = slots == exploded_block.slot if field.contains(exploded_block) else np.zeros(len(slots), bool)
+        dx = center_x - exploded_block.rect.centerx
+        dy = center_y - exploded_block.rect.centery
+        caught = (dx * dx + dy * dy <= radius_sq) & ~visited
+        
+        destroyed_slots = []
+        sources = [exploded_block]
+        centers = []
+        while sources:
+            centers.extend(source.rect.center for source in sources)
+            
+            # Bu dalgada kırılanlar; aralarındaki patlayıcılar sonraki dalgayı oluşturur
+            visited |= caught
+            destroyed_slots.append(slots[caught])
+            chained = caught[explosive]
+            sources = [objects[slot] for slot in slots[explosive[chained]].tolist()]
+            if sources:
+                caught = reach[chained].any(axis=0) & ~visited
+            
+        destroyed_slots = np.concatenate(destroyed_slots)
+        destroyed = [objects[slot] for slot in destroyed_slots.tolist()]
+        power_ups = destroyed_slots[field.powerup[destroyed_slots]]
+        power_up_x, power_up_y = field.get_centers(power_ups)
+        points = int(field.points[destroyed_slots].sum())
+        self.remove_blocks(destroyed)
+        return {
+            "destroyed": destroyed,
+            "points": points,
+            "power_ups": list(zip(power_up_x.tolist(), power_up_y.tolist())),
+            "explosions": len(centers),
+            "centers": centers
+        }
             
     def handle_mystery_block(self, mystery_block):
         # Rastgele bir efekt uygula
@@ -332,15 +575,16 @@ class BlockManager:
             return {"type": "power_up", "value": True}
         elif effect == "clear_row":
             # Aynı satırdaki tüm blokları temizle
-            row_y = mystery_block.rect.y
-            blocks_to_remove = [b for b in self.blocks if b.rect.y == row_y]
-            for block in blocks_to_remove:
-                self.blocks.remove(block)
+            blocks_to_remove = self.get_row(mystery_block.rect.y)
+            self.remove_blocks(blocks_to_remove)
             return {"type": "points", "value": len(blocks_to_remove) * 20}
             
-    def draw(self, screen):
-        for block in self.blocks:
-            block.draw(screen)
+    def draw(self, screen, blocks=None):
+        # Tüm blokları tek bir blits çağrısıyla çiz
+        if blocks is None:
+            blocks = self.blocks
+        screen.blits([block.get_blit() for block in blocks], doreturn=False)
             
     def get_remaining_blocks(self):
-        return len(self.blocks) 
\ No newline at end of file
+        """Kalan blok sayısı (blok listesini yeniden oluşturmadan)"""
+        return len(self.field)
\ No newline at end of file
@@ -1,4 +1,7 @@
 import pygame
+from font_cache import get_font, render_text
+from screen_composer import screen_composer
+from sound_bank import sound_bank
 import json
 
 class GameSettings:
@@ -11,7 +14,7 @@ class GameSettings:
         # Ses sistemini başlat
         if not pygame.mixer.get_init():
             pygame.mixer.init()
-            pygame.mixer.set_num_channels(8)  # 8 ses kanalı ayarla
+        sound_bank.voices.open()  # Kanalları müzik, arayüz ve oyun gruplarına ayır
         
         # Settings instance'ı oluştur
         from settings import Settings
@@ -21,8 +24,8 @@ class GameSettings:
         self.settings_manager.apply_sound_settings()
         
         # Fontlar
-        self.title_font = pygame.font.Font(None, int(0.08 * screen_height))
-        self.text_font = pygame.font.Font(None, int(0.04 * screen_height))
+        self.title_font = get_font(0.08 * screen_height)
+        self.text_font = get_font(0.04 * screen_height)
         
         # Renkler
         self.colors = {
@@ -59,35 +62,20 @@ class GameSettings:
         
         # Geri butonu
         self.back_button = pygame.Rect(20, 20, 100, 40)
-        
-        try:
-            self.background = pygame.image.load("images/arka_plan.jpg")
-            self.background = pygame.transform.scale(self.background, (screen_width, screen_height))
-        except:
-            self.background = None
             
     def draw(self):
-        # Arka plan
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(self.colors["background"])
-            
-        # Yarı saydam overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        # Arka plan ve yarı saydam overlay (önceden birleştirilmiş)
+        screen_composer.draw_background(self.screen, "images/arka_plan.jpg", 128, self.colors["background"])
         
         # Başlık
-        title = self.title_font.render("Ayarlar", True, self.colors["text"])
+        title = render_text(self.title_font, "Ayarlar", self.colors["text"])
         title_rect = title.get_rect(center=(self.screen_width//2, self.screen_height * 0.1))
         self.screen.blit(title, title_rect)
         
         # Kategori seçici
         category_y = self.screen_height * 0.2
         for i, category in enumerate(self.categories):
-            text = self.text_font.render(category, True, 
+            text = render_text(self.text_font, category, 
                                        self.colors["secondary"] if i == self.current_category 
                                        else self.colors["text"])
             text_rect = text.get_rect(center=(self.screen_width * (0.25 + i * 0.25), category_y))
@@ -109,7 +97,7 @@ class GameSettings:
             
         # Geri butonu
         pygame.draw.rect(self.screen, self.colors["warning"], self.back_button, border_radius=5)
-        back_text = self.text_font.render("Geri", True, self.colors["text"])
+        back_text = render_text(self.text_font, "Geri", self.colors["text"])
         text_rect = back_text.get_rect(center=self.back_button.center)
         self.screen.blit(back_text, text_rect)
             
@@ -135,7 +123,7 @@ class GameSettings:
             else:
                 display_value = value
             
-            text = self.text_font.render(display_name, True, self.colors["text"])
+            text = render_text(self.text_font, display_name, self.colors["text"])
             self.screen.blit(text, (self.screen_width * 0.2, start_y + i * 80))
             
             # Slider çubuğu
@@ -149,7 +137,7 @@ class GameSettings:
             pygame.draw.rect(self.screen, self.colors["primary"], value_rect)
             
             # Değer yüzdesi (gerçek ses seviyesini göster)
-            value_text = self.text_font.render(f"{int(display_value * 100)}%", True, self.colors["text"])
+            value_text = render_text(self.text_font, f"{int(display_value * 100)}%", self.colors["text"])
             self.screen.blit(value_text, (self.screen_width * 0.4 + 220, start_y + i * 80 + 20))
             
             i += 1
@@ -161,13 +149,13 @@ class GameSettings:
             color = self.colors["secondary"] if i == self.current_theme else self.colors["primary"]
             pygame.draw.rect(self.screen, color, button_rect, border_radius=5)
             
-            text = self.text_font.render(theme, True, self.colors["text"])
+            text = render_text(self.text_font, theme, self.colors["text"])
             text_rect = text.get_rect(center=button_rect.center)
             self.screen.blit(text, text_rect)
             
     def draw_control_settings(self, start_y):
         for i, (action, key) in enumerate(self.control_settings.items()):
-            text = self.text_font.render(f"{action.title()}: {key}", True, self.colors["text"])
+            text = render_text(self.text_font, f"{action.title()}: {key}", self.colors["text"])
             self.screen.blit(text, (self.screen_width * 0.3, start_y + i * 40))
             
     def handle_event(self, event):
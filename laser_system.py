@@ -0,0 +1,109 @@
+import numpy as np
+import pygame
+from assets import convert_surface
+
+class LaserPool:
+    """Sabit kapasiteli, NumPy dizilerinde tutulan lazer havuzu.
+
+    Canlı lazerler dizilerin başında [0, count) aralığında sıkışık tutulur;
+    hareket, ekrandan çıkanların atılması ve blok vuruşları toplu yapılır.
+    """
+    def __init__(self, capacity=256, width=4, height=10, speed=10, color=(231, 76, 60)):
+        self.capacity = capacity
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.color = color
+        self.x = np.zeros(capacity, dtype=np.int32)  # Sol kenar
+        self.y = np.zeros(capacity, dtype=np.float64)  # Üst kenar (alt piksel)
+        self.count = 0
+        self.sprite = None
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def live_y(self):
+        """Canlı lazerlerin y konumları (dizinin görünümü)"""
+        return self.y[:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def fire(self, x, y):
+        """(x, y) sol üst köşesinden yukarı giden bir lazer ekle"""
+        if self.count >= self.capacity:
+            return False
+        self.x[self.count] = x
+        self.y[self.count] = y
+        self.count += 1
+        return True
+
+    def keep(self, mask):
+        """mask True olan lazerleri bırak, kalanları sıkıştır"""
+        n = self.count
+        kept = int(np.count_nonzero(mask))
+        if kept != n:
+            self.x[:kept] = self.x[:n][mask]
+            self.y[:kept] = self.y[:n][mask]
+            self.count = kept
+
+    def get_tops(self):
+        """Çizimde kullanılan tam sayı üst kenarlar"""
+        return np.floor(self.y[:self.count] + 0.5).astype(np.int32)
+
+    def update(self, dt=1.0):
+        """Lazerleri yukarı taşı, ekrandan çıkanları at"""
+        n = self.count
+        if n == 0:
+            return
+        self.y[:n] -= self.speed * dt
+        self.keep(self.get_tops() + self.height >= 0)
+
+    def find_block_hits(self, block_manager):
+        """Bloklara değen lazerleri bul ve havuzdan çıkar.
+
+        Her bloğa adımda en fazla bir lazer vurur (lazerler sırayla kendi
+        ilk boştaki bloğunu alır); vurulan blokları döndürür.
+        """
+        n = self.count
+        if n == 0 or not len(block_manager.field):
+            return []
+        left = self.x[:n]
+        top = self.get_tops()
+        right, bottom = left + self.width, top + self.height
+        slots = block_manager.query_slots(left, top, right, bottom)  # Izgaradan adaylar
+        if len(slots) == 0:
+            return []
+        hits, slots = block_manager.field.find_overlaps(left, top, right, bottom, slots)
+        lasers = np.flatnonzero(hits.any(axis=1))
+        if len(lasers) == 0:
+            return []
+
+        # Aynı bloğa birden fazla lazer değiyorsa sadece ilki harcanır
+        taken = []
+        spent = np.zeros(n, dtype=bool)
+        for i in lasers.tolist():
+            for j in np.flatnonzero(hits[i]).tolist():
+                if j not in taken:
+                    taken.append(j)
+                    spent[i] = True
+                    break
+        self.keep(~spent)
+        objects = block_manager.field.objects
+        return [objects[slot] for slot in slots[taken].tolist()]
+
+    def draw(self, screen):
+        n = self.count
+        if n == 0:
+            return
+        if self.sprite is None:
+            sprite = pygame.Surface((self.width, self.height))
+            sprite.fill(self.color)
+            self.sprite, _ = convert_surface(sprite, transparent=False)
+        positions = zip(self.x[:n].tolist(), self.get_tops().tolist())
+        screen.blits([(self.sprite, position) for position in positions], doreturn=False)
+
+    def get_draw_rects(self):
+        return [pygame.Rect(x, y, self.width, self.height)
+                for x, y in zip(self.x[:self.count].tolist(), self.get_tops().tolist())]
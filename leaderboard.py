@@ -1,6 +1,8 @@
 import pygame
 import json
 from datetime import datetime, timedelta
+from font_cache import get_font, render_text
+from screen_composer import screen_composer
 
 class Leaderboard:
     def __init__(self, screen, screen_width, screen_height):
@@ -9,9 +11,9 @@ class Leaderboard:
         self.screen_height = screen_height
         
         # Fontlar
-        self.title_font = pygame.font.Font(None, int(0.08 * screen_height))
-        self.header_font = pygame.font.Font(None, int(0.05 * screen_height))
-        self.text_font = pygame.font.Font(None, int(0.04 * screen_height))
+        self.title_font = get_font(0.08 * screen_height)
+        self.header_font = get_font(0.05 * screen_height)
+        self.text_font = get_font(0.04 * screen_height)
         
         # Renkler
         self.colors = {
@@ -37,12 +39,6 @@ class Leaderboard:
         # Geri butonu
         self.back_button = pygame.Rect(20, 20, 100, 40)
         
-        try:
-            self.background = pygame.image.load("images/arka_plan.jpg")
-            self.background = pygame.transform.scale(self.background, (screen_width, screen_height))
-        except:
-            self.background = None
-        
     def draw_score_card(self, pos, rank, score_data, highlight=False):
         x, y = pos
         width = self.screen_width * 0.8
@@ -59,36 +55,27 @@ class Leaderboard:
             medal_colors = [self.colors["gold"], self.colors["silver"], self.colors["bronze"]]
             pygame.draw.circle(self.screen, medal_colors[rank-1], 
                              (x + 30, y + height//2 + self.animation_offset), 20)
-            rank_text = self.header_font.render(str(rank), True, self.colors["text"])
+            rank_text = render_text(self.header_font, str(rank), self.colors["text"])
         else:
-            rank_text = self.header_font.render(f"#{rank}", True, self.colors["text"])
+            rank_text = render_text(self.header_font, f"#{rank}", self.colors["text"])
         
         rank_rect = rank_text.get_rect(center=(x + 30, y + height//2 + self.animation_offset))
         self.screen.blit(rank_text, rank_rect)
         
         # Oyuncu bilgileri (score_data bir tuple: (username, score))
         username, score = score_data
-        name_text = self.text_font.render(str(username), True, self.colors["text"])
-        score_text = self.text_font.render(str(score), True, self.colors["text"])
+        name_text = render_text(self.text_font, str(username), self.colors["text"])
+        score_text = render_text(self.text_font, str(score), self.colors["text"])
         
         self.screen.blit(name_text, (x + 80, y + 20 + self.animation_offset))
         self.screen.blit(score_text, (x + width - 150, y + 20 + self.animation_offset))
         
     def draw(self, scores):
-        # Arka plan
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(self.colors["background"])
-            
-        # Yarı saydam overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        # Arka plan ve yarı saydam overlay (önceden birleştirilmiş)
+        screen_composer.draw_background(self.screen, "images/arka_plan.jpg", 128, self.colors["background"])
         
         # Başlık
-        title = self.title_font.render("En Yüksek Skorlar", True, self.colors["text"])
+        title = render_text(self.title_font, "En Yüksek Skorlar", self.colors["text"])
         title_rect = title.get_rect(center=(self.screen_width//2, self.screen_height * 0.08))
         self.screen.blit(title, title_rect)
         
@@ -98,9 +85,9 @@ class Leaderboard:
         start_x = (self.screen_width - total_width) // 2
         
         for i, category in enumerate(self.categories):
-            text = self.text_font.render(category, True, 
-                                       self.colors["secondary"] if i == self.current_category 
-                                       else self.colors["text"])
+            text = render_text(self.text_font, category,
+                               self.colors["secondary"] if i == self.current_category
+                               else self.colors["text"])
             text_rect = text.get_rect(center=(start_x + i * (total_width // len(self.categories)), category_y))
             self.screen.blit(text, text_rect)
             
@@ -122,13 +109,13 @@ class Leaderboard:
                 )
         else:
             # Skor yoksa mesaj göster
-            no_scores_text = self.text_font.render("Henüz skor kaydı yok", True, self.colors["text"])
+            no_scores_text = render_text(self.text_font, "Henüz skor kaydı yok", self.colors["text"])
             text_rect = no_scores_text.get_rect(center=(self.screen_width//2, self.screen_height//2))
             self.screen.blit(no_scores_text, text_rect)
             
         # Geri butonu
         pygame.draw.rect(self.screen, self.colors["warning"], self.back_button, border_radius=5)
-        back_text = self.text_font.render("Geri", True, self.colors["text"])
+        back_text = render_text(self.text_font, "Geri", self.colors["text"])
         text_rect = back_text.get_rect(center=self.back_button.center)
         self.screen.blit(back_text, text_rect)
         
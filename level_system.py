@@ -1,7 +1,8 @@
 import random
-import pygame
 import os
 import math
+from assets import asset_manager, load_image
+from block_atlas import BlockAtlas
 
 class LevelSystem:
     def __init__(self, screen_width, screen_height):
@@ -10,6 +11,7 @@ class LevelSystem:
         self.current_level = 1
         self.max_level = 3  # Maksimum seviye sayısı
         self.levels = {}
+        self.block_atlases = {}  # Seviye -> blok görselleri atlası
         
         # Seviye tasarımları
         self.level_designs = {
@@ -87,7 +89,7 @@ class LevelSystem:
         level_data = self.levels[level]
         
         # Blok yöneticisini temizle
-        block_manager.blocks.clear()
+        block_manager.clear()
         
         # Seviyeye göre farklı dizilim desenleri
         patterns = [
@@ -104,24 +106,42 @@ class LevelSystem:
         
         # Blok görsellerini ayarla
         if level in self.level_designs:
-            design = self.level_designs[level]
+            atlas = self.get_block_atlas(level, block_manager)
+            
             for block in block_manager.blocks:
-                if block.block_type == "normal" and "block_single_hit" in design:
-                    img = pygame.image.load(design["block_single_hit"])
-                    block.image = pygame.transform.scale(img, (block.rect.width, block.rect.height))
-                elif block.block_type == "hard" and "block_double_hit" in design:
-                    img = pygame.image.load(design["block_double_hit"])
-                    block.double_hit_image = pygame.transform.scale(img, (block.rect.width, block.rect.height))
-                    block.image = block.double_hit_image
-                elif block.block_type == "boss" and "boss" in design:
-                    img = pygame.image.load(design["boss"])
-                    block.image = pygame.transform.scale(img, (block.rect.width, block.rect.height))
+                if block.block_type == "normal":
+                    key = "block_single_hit"
+                elif block.block_type == "hard":
+                    key = "block_double_hit"
+                elif block.block_type == "boss":
+                    key = "boss"
+                else:
+                    continue
+                    
+                if atlas.get_region(key):
+                    block.image = atlas.get_image(key)
+                    block.atlas = atlas.surface
+                    block.atlas_area = atlas.get_region(key)
+                    if key == "block_double_hit":
+                        block.double_hit_image = block.image
         
         return {
             "ball_speed": level_data["ball_speed"],
             "points_multiplier": level_data["points_multiplier"]
         }
 
+    def get_block_atlas(self, level, block_manager):
+        """Seviye temasının blok görsellerini tek bir atlas yüzeyinde topla (bir kez)"""
+        if level not in self.block_atlases:
+            design = self.level_designs[level]
+            block_size = (block_manager.block_width, block_manager.block_height)
+            images = {}
+            for key in ("block_single_hit", "block_double_hit", "boss"):
+                if key in design:
+                    images[key] = load_image(design[key], block_size)
+            self.block_atlases[level] = BlockAtlas(images)
+        return self.block_atlases[level]
+
     def create_random_pattern(self, level, level_data, block_manager):
         """Tamamen rastgele blok dizilimi"""
         rows = min(3 + level, 8)
@@ -219,11 +239,8 @@ class LevelSystem:
         return "normal"
         
     def is_level_complete(self, block_manager):
-        # Yıkılabilir blok kaldı mı kontrol et
-        for block in block_manager.blocks:
-            if block.block_type != "indestructible":
-                return False
-        return True
+        # Yıkılabilir blok kaldı mı kontrol et (BlockManager sayacından)
+        return block_manager.destructible_count == 0
         
     def get_level_info(self, level):
         if level in self.levels:
@@ -234,6 +251,22 @@ class LevelSystem:
         self.current_level = level
         return self.get_level_info(level) 
         
+    def prefetch_level_assets(self, level, block_manager):
+        """Seviyenin görsellerini oyun sürerken arka planda çözmeye başla"""
+        if level not in self.level_designs:
+            return
+        design = self.level_designs[level]
+        block_size = (block_manager.block_width, block_manager.block_height)
+        sizes = {
+            "background": (self.screen_width, self.screen_height),
+            "platform": None,
+            "sticky_platform": None,
+            "block_single_hit": block_size,
+            "block_double_hit": block_size,
+            "boss": block_size
+        }
+        asset_manager.prefetch([(design[key], size) for key, size in sizes.items() if key in design])
+        
     def load_level_assets(self, level, platform):
         """Seviye görsellerini ve seslerini yükle"""
         print(f"Seviye {level} için görsel yükleniyor...")
@@ -244,20 +277,21 @@ class LevelSystem:
             # Platform görsellerini yükle ve boyutlandır
             if "platform" in design:
                 print(f"Platform görseli yükleniyor: {design['platform']}")
-                platform_img = pygame.image.load(design["platform"])
+                platform_img = load_image(design["platform"])
                 platform.set_image(platform_img)
                 
             if "sticky_platform" in design:
                 print(f"Yapışkan platform görseli yükleniyor: {design['sticky_platform']}")
-                sticky_img = pygame.image.load(design["sticky_platform"])
+                sticky_img = load_image(design["sticky_platform"])
                 platform.set_sticky_image(sticky_img)
                 
             # Arka plan görselini yükle ve boyutlandır
             if "background" in design:
                 try:
                     print(f"Arka plan yükleniyor: {design['background']}")
-                    bg_img = pygame.image.load(design["background"])
-                    scaled_bg = pygame.transform.scale(bg_img, (self.screen_width, self.screen_height))
+                    scaled_bg = load_image(design["background"], (self.screen_width, self.screen_height))
+                    if scaled_bg is None:
+                        return None
                     print("Arka plan başarıyla yüklendi ve ölçeklendirildi")
                     return scaled_bg
                 except Exception as e:
@@ -1,7 +1,6 @@
 import pygame
 import sys
 from database import Database
-import os
 from game_objects import Platform, Ball, BlockManager
 from game_logic import GameLogic
 from level_system import LevelSystem
@@ -10,6 +9,16 @@ from leaderboard import Leaderboard
 from game_settings import GameSettings
 from profile import Profile
 from game_states import GameState, GameError
+from render_system import DirtyRectRenderer, RenderTarget, StaticLayer
+from settings import Settings
+from font_cache import get_font, render_text
+from assets import asset_manager, load_image
+from sound_bank import sound_bank
+from screen_composer import screen_composer
+from ui_widgets import Button
+from frame_governor import FrameGovernor
+from particle_system import ParticleSystem
+from simulation import FixedTimestep
 import math
 
 # Renk tanımlamaları
@@ -23,61 +32,33 @@ pygame.init()
 if not pygame.mixer.get_init():
     pygame.mixer.init()
 
-# Ekran ayarları
+# Ekran ayarları (tüm sistemler bu mantıksal çözünürlükte çalışır)
 screen_width = 800
 screen_height = 600
-screen = pygame.display.set_mode((screen_width, screen_height))
+render_target = RenderTarget((screen_width, screen_height))
+asset_manager.set_budget(Settings().get_setting("performance", "asset_budget_mb") * 1024 * 1024)
+screen = render_target.surface
 pygame.display.set_caption("Breakout")
 
-# Ses efektleri
-def load_sound(file_path):
-    try:
-        return pygame.mixer.Sound(file_path)
-    except Exception as e:
-        print(f"Ses dosyası yüklenemedi ({file_path}): {e}")
-        return None
-
+# Müzik ve arayüz sesleri (ses bankasında kendi kanal gruplarına bağlanır)
 try:
-    # Ses dosyalarının yolları
-    sound_files = {
-        "hit": "Assests/topsesi.mp3",
-        "score": "Assests/skorses.mp3",
+    sound_bank.bind_many({
         "background": "Assests/background_sound.mp3",
+        "menu_music": "Assests/sound/giriş_ekranı_sesi.mp3"
+    }, category="music", priority=5, max_voices=1, volume=1.0)
+    
+    # Oyun içi çarpışma sesleri bu sesleri bastıramaz
+    sound_bank.bind_many({
         "gameover": "Assests/gameover.mp3",
-        "menu_music": "Assests/sound/giriş_ekranı_sesi.mp3",
         "level_up": "Assests/sound/level_atlama.mp3",
         "lose_game": "Assests/sound/kaybetme_sesi.mp3"
-    }
-    
-    # Ses dosyalarını yükle
-    sounds = {}
-    for sound_name, file_path in sound_files.items():
-        if os.path.exists(file_path):
-            sounds[sound_name] = load_sound(file_path)
-        else:
-            print(f"Ses dosyası bulunamadı: {file_path}")
+    }, category="ui", priority=4, max_voices=1, volume=1.0)
             
     # Arka plan müziğini başlat
-    if sounds.get("menu_music"):
-        sounds["menu_music"].play(-1)
+    sound_bank.play("menu_music", loops=-1)
 except Exception as e:
     print(f"Ses sistemi başlatılırken hata: {e}")
 
-# Görsel dosyaları yükleme fonksiyonu
-def load_image(file_path, size=None):
-    try:
-        if not os.path.exists(file_path):
-            print(f"Görsel dosyası bulunamadı: {file_path}")
-            return None
-            
-        image = pygame.image.load(file_path)
-        if size:
-            image = pygame.transform.scale(image, size)
-        return image
-    except Exception as e:
-        print(f"Görsel dosyası yüklenemedi ({file_path}): {e}")
-        return None
-
 # Modern Menü Sınıfı
 class ModernMenu:
     def __init__(self, screen, screen_width, screen_height):
@@ -97,8 +78,8 @@ class ModernMenu:
         
         try:
             # Font
-            self.title_font = pygame.font.Font(None, int(screen_height * 0.1))
-            self.button_font = pygame.font.Font(None, int(screen_height * 0.05))
+            self.title_font = get_font(screen_height * 0.1)
+            self.button_font = get_font(screen_height * 0.05)
             
             # Animasyon değişkenleri
             self.animation_offset = 0
@@ -134,18 +115,17 @@ class ModernMenu:
     def create_button(self, text, y_pos, color):
         button_width = 250
         button_height = 50
-        return {
-            "rect": pygame.Rect((self.screen_width - button_width) // 2, y_pos, 
-                              button_width, button_height),
-            "text": text,
-            "color": color,
-            "hover": False
-        }
+        return Button(
+            pygame.Rect((self.screen_width - button_width) // 2, y_pos, 
+                        button_width, button_height),
+            text, self.button_font, color, self.colors["text"],
+            hover_border=self.colors["text"], glow=True
+        )
             
     def update(self, mouse_pos):
         try:
             for button in self.buttons.values():
-                button["hover"] = button["rect"].collidepoint(mouse_pos)
+                button.update(mouse_pos)
                 
             # Animasyon güncelleme
             self.animation_offset = (self.animation_offset + 2) % 360
@@ -161,7 +141,7 @@ class ModernMenu:
                 self.screen.fill(self.colors["background"])
             
             # Başlık
-            title = self.title_font.render("BREAKOUT", True, self.colors["text"])
+            title = render_text(self.title_font, "BREAKOUT", self.colors["text"])
             title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height * 0.2))
             self.screen.blit(title, title_rect)
             
@@ -176,49 +156,15 @@ class ModernMenu:
             
     def draw_button(self, button):
         try:
-            # Hover efekti
-            color = button["color"]
-            if button["hover"]:
-                color = tuple(min(c + 30, 255) for c in color)
-                
-            # Buton arka planı
-            pygame.draw.rect(self.screen, color, button["rect"], border_radius=10)
-            
-            # Buton kenarlığı
-            if button["hover"]:
-                pygame.draw.rect(self.screen, self.colors["text"], 
-                               button["rect"], 3, border_radius=10)
-            
-            # Buton metni
-            text = self.button_font.render(button["text"], True, self.colors["text"])
-            text_rect = text.get_rect(center=button["rect"].center)
-            self.screen.blit(text, text_rect)
-            
-            # Animasyonlu vurgu efekti
-            if button["hover"]:
-                self.draw_button_glow(button, color)
-                
+            # Hazır durum yüzeyini çiz (normal / hover / parlama)
+            button.draw(self.screen)
         except Exception as e:
             print(f"Buton çizilirken hata: {e}")
             
-    def draw_button_glow(self, button, color):
-        try:
-            glow_surface = pygame.Surface((button["rect"].width + 20, 
-                                         button["rect"].height + 20), 
-                                        pygame.SRCALPHA)
-            glow_color = color + (128,)  # Alpha değeri ekle
-            pygame.draw.rect(glow_surface, glow_color, 
-                           (10, 10, button["rect"].width, button["rect"].height), 
-                           border_radius=10)
-            self.screen.blit(glow_surface, 
-                           (button["rect"].x - 10, button["rect"].y - 10))
-        except Exception as e:
-            print(f"Buton efekti çizilirken hata: {e}")
-            
     def draw_fallback_menu(self):
         try:
             self.screen.fill(self.colors["background"])
-            text = self.button_font.render("Menü yüklenemedi", True, self.colors["text"])
+            text = render_text(self.button_font, "Menü yüklenemedi", self.colors["text"])
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             self.screen.blit(text, text_rect)
         except Exception as e:
@@ -227,7 +173,7 @@ class ModernMenu:
     def handle_click(self, mouse_pos):
         try:
             for button_name, button in self.buttons.items():
-                if button["rect"].collidepoint(mouse_pos):
+                if button.is_clicked(mouse_pos):
                     return button_name
             return None
         except Exception as e:
@@ -254,14 +200,14 @@ def handle_error(error, screen, font):
     error_surface.fill((44, 62, 80))  # Koyu mavi arka plan
     
     # Başlık
-    title_text = font.render(error_title, True, (231, 76, 60))  # Kırmızı
+    title_text = render_text(font, error_title, (231, 76, 60))  # Kırmızı
     title_rect = title_text.get_rect(centerx=200, y=20)
     error_surface.blit(title_text, title_rect)
     
     # Hata mesajı
     message_lines = [error.message[i:i+30] for i in range(0, len(error.message), 30)]
     for i, line in enumerate(message_lines):
-        message_text = font.render(line, True, (236, 240, 241))  # Beyaz
+        message_text = render_text(font, line, (236, 240, 241))  # Beyaz
         message_rect = message_text.get_rect(centerx=200, y=80 + i*30)
         error_surface.blit(message_text, message_rect)
     
@@ -269,7 +215,7 @@ def handle_error(error, screen, font):
     screen.blit(error_surface, 
                ((screen.get_width() - 400) // 2, 
                 (screen.get_height() - 200) // 2))
-    pygame.display.flip()
+    render_target.present()
     
     # Hata logunu kaydet
     with open("error_log.txt", "a") as log_file:
@@ -302,9 +248,9 @@ settings_menu.set_game_state(game_state)
 
 # Font
 try:
-    default_font = pygame.font.Font(None, 36)  # Default sistem fontu
-    title_font = pygame.font.Font(None, 72)    # Başlık için büyük font
-    button_font = pygame.font.Font(None, 32)   # Butonlar için orta boy font
+    default_font = get_font(36)  # Default sistem fontu
+    title_font = get_font(72)    # Başlık için büyük font
+    button_font = get_font(32)   # Butonlar için orta boy font
 except Exception as e:
     print(f"Font yükleme hatası: {e}")
     pygame.quit()
@@ -324,10 +270,10 @@ class ModernInputBox:
         self.text_color = (255, 255, 255)  # Beyaz
         self.active = False
         try:
-            self.font = pygame.font.Font(None, 32)
-            self.txt_surface = self.font.render(
+            self.font = get_font(32)
+            self.txt_surface = render_text(
+                self.font,
                 text if text else placeholder,
-                True,
                 self.text_color if text else self.placeholder_color
             )
         except Exception as e:
@@ -368,15 +314,15 @@ class ModernInputBox:
             # Metin yüzeyini güncelle
             display_text = '*' * len(self.text) if self.password else self.text
             if display_text:
-                self.txt_surface = self.font.render(
+                self.txt_surface = render_text(
+                    self.font,
                     display_text,
-                    True,
                     self.text_color
                 )
             else:
-                self.txt_surface = self.font.render(
+                self.txt_surface = render_text(
+                    self.font,
                     self.placeholder,
-                    True,
                     self.placeholder_color
                 )
                 
@@ -392,9 +338,9 @@ class ModernInputBox:
         # Metin
         if len(self.text) > 0:
             display_text = '*' * len(self.text) if self.password else self.text
-            self.txt_surface = self.font.render(display_text, True, self.text_color)
+            self.txt_surface = render_text(self.font, display_text, self.text_color)
         else:
-            self.txt_surface = self.font.render(self.placeholder, True, self.placeholder_color)
+            self.txt_surface = render_text(self.font, self.placeholder, self.placeholder_color)
             
         # Metni ortala
         text_rect = self.txt_surface.get_rect(center=self.rect.center)
@@ -440,7 +386,7 @@ def reset_game():
         platform.reset()
         
         # Blokları tamamen sıfırla
-        block_manager.blocks.clear()  # Mevcut blokları temizle
+        block_manager.clear()  # Mevcut blokları temizle
         
         # İlgili level tasarımını al ve blokları yeniden oluştur
         level_data = level_system.get_level_layout(game_state.level, block_manager)
@@ -448,63 +394,61 @@ def reset_game():
         # Seviye görsellerini yükle
         global current_background
         current_background = level_system.load_level_assets(game_state.level, platform)
+        level_system.prefetch_level_assets(game_state.level + 1, block_manager)
         
         # Top hızını level datasından ayarla
         ball.speed = level_data["ball_speed"]
         ball.original_speed = ball.speed
         
-        # Power-up'ları temizle
+        # Power-up'ları ve parçacıkları temizle
         power_up_manager.power_ups.clear()
         power_up_manager.active_effects.clear()
+        particle_system.clear()
         
         # Menü müziğini durdur, oyun müziğini başlat
-        if sounds.get("menu_music"):
-            sounds["menu_music"].stop()
-        if sounds.get("background"):
-            sounds["background"].play(-1)
+        sound_bank.stop("menu_music")
+        sound_bank.play("background", loops=-1)
 
     except Exception as e:
         raise GameError(f"Oyun sıfırlanırken hata: {str(e)}", "general")
 
-def handle_game_input():
+def handle_game_input(dt=1.0):
     try:
         keys = pygame.key.get_pressed()
         
         # Platform kontrolü - klavye
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            platform.move("left", screen_width)
+            platform.move("left", screen_width, dt)
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            platform.move("right", screen_width)
+            platform.move("right", screen_width, dt)
             
         # Platform kontrolü - fare
         mouse_x, _ = pygame.mouse.get_pos()
         platform_center = platform.rect.centerx
         if abs(mouse_x - platform_center) > 5:  # Küçük bir ölü bölge
             if mouse_x < platform_center:
-                platform.move("left", screen_width)
+                platform.move("left", screen_width, dt)
             else:
-                platform.move("right", screen_width)
+                platform.move("right", screen_width, dt)
             
         # Top fırlatma
         if not ball.active and (keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]):
             ball.launch()
-            if "hit" in sounds:
-                sounds["hit"].play()
+            sound_bank.play("hit")
             
         # Yapışkan platform kontrolü
         if platform.sticky and ball.active:
             if keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]:
                 platform.sticky = False
                 ball.launch()
-                if "hit" in sounds:
-                    sounds["hit"].play()
+                sound_bank.play("hit")
                     
         # Lazer kontrolü
         if platform.has_laser and (keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]):
             platform.shoot_laser()
             
         # Platform lazerlerini güncelle
-        platform.update_lasers()
+        platform.update_lasers(dt)
                     
         # Menüye dönme
         if keys[pygame.K_m]:
@@ -535,17 +479,17 @@ def draw_game():
         power_up_manager.draw(screen)
         
         # HUD
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Skor: {game_state.score}", True, WHITE)
-        lives_text = font.render(f"Can: {game_state.lives}", True, WHITE)
-        level_text = font.render(f"Seviye: {game_state.level}", True, WHITE)
+        font = get_font(36)
+        score_text = render_text(font, f"Skor: {game_state.score}", WHITE)
+        lives_text = render_text(font, f"Can: {game_state.lives}", WHITE)
+        level_text = render_text(font, f"Seviye: {game_state.level}", WHITE)
         
         screen.blit(score_text, (10, 10))
         screen.blit(lives_text, (screen_width - 100, 10))
         screen.blit(level_text, (screen_width // 2 - 50, 10))
         
         if game_state.paused:
-            pause_text = font.render("DURAKLAT", True, WHITE)
+            pause_text = render_text(font, "DURAKLAT", WHITE)
             pause_rect = pause_text.get_rect(center=(screen_width // 2, screen_height // 2))
             screen.blit(pause_text, pause_rect)
             
@@ -560,109 +504,20 @@ def check_game_over():
                 db.update_high_score(game_state.current_user['username'], game_state.score)
             
             # Oyun bitti sesini çal
-            if "gameover" in sounds:
-                sounds["gameover"].play()
+            sound_bank.play("gameover")
                 
             # Oyun durumunu değiştir
             game_state.change_state("game_over")
     except Exception as e:
         game_state.set_error(f"Oyun sonu kontrolü sırasında hata: {str(e)}")
 
-def update_game():
-    try:
-        if not game_state.paused:
-            # Top ve platform güncellemeleri
-            if ball.active:
-                ball.move()
-                
-            # Çarpışma kontrolü ve skor güncellemesi
-            if game_state.state == "game":  # Sadece oyun durumunda skor güncelle
-                new_score = game_logic.check_collisions(ball, platform, block_manager, power_up_manager, game_state)
-                if new_score > game_state.score:
-                    game_state.score = new_score
-                    if "score" in sounds:
-                        sounds["score"].play()
-            
-            # Can kaybı kontrolü
-            if ball.y + ball.radius > screen_height:
-                game_state.lives -= 1
-                if game_state.lives <= 0:
-                    # Yüksek skoru güncelle
-                    if game_state.is_logged_in():
-                        db.update_high_score(game_state.current_user['username'], game_state.score)
-                    # Oyun bitti sesini çal
-                    if "lose_game" in sounds:
-                        sounds["lose_game"].play()
-                    game_state.change_state("game_over")
-                else:
-                    ball.reset()
-                    platform.reset()
-            
-            # Level kontrolü
-            if level_system.is_level_complete(block_manager):
-                game_state.level += 1
-                print(f"Yeni seviye: {game_state.level}")
-                
-                # Oyun tamamlandı mı kontrol et
-                if level_system.is_game_complete(game_state.level):
-                    # Oyun kazanıldı
-                    if "level_up" in sounds:
-                        sounds["level_up"].play()
-                    game_state.change_state("game_won")
-                else:
-                    # Sonraki seviyeye geç
-                    # Oyun nesnelerini sıfırla
-                    ball.reset()
-                    platform.reset()
-                    
-                    # Yeni level için arkaplanı güncelle
-                    global current_background
-                    current_background = level_system.load_level_assets(game_state.level, platform)
-                    print(f"Yeni arkaplan yüklendi: {current_background is not None}")
-                    
-                    # Level tasarımını yükle
-                    level_data = level_system.get_level_layout(game_state.level, block_manager)
-                    ball.speed = level_data["ball_speed"]
-                    
-                    # Level up sesini çal
-                    if "level_up" in sounds:
-                        sounds["level_up"].play()
-                    
-                    # Power-up'ları temizle
-                    power_up_manager.power_ups.clear()
-                    power_up_manager.active_effects.clear()
-            
-            # Power-up güncelleme
-            power_up_manager.update(platform, ball)
-            
-            # Blok güncellemeleri
-            block_manager.update()
-            
-            # Yapışkan platform kontrolü
-            if platform.sticky and ball.active:
-                ball.attach_to_platform(platform)
-                
-    except Exception as e:
-        raise GameError(f"Oyun güncellenirken hata: {e}", "general")
-
 def draw_modern_login_screen():
     try:
-        # Arka plan
-        try:
-            background = pygame.image.load("images/arka_plan.jpg")
-            background = pygame.transform.scale(background, (screen_width, screen_height))
-            screen.blit(background, (0, 0))
-        except:
-            screen.fill((44, 62, 80))  # Koyu mavi
-        
-        # Yarı saydam overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        # Arka plan ve yarı saydam overlay (önceden birleştirilmiş)
+        screen_composer.draw_background(screen, "images/arka_plan.jpg", 128, (44, 62, 80))
         
         # Başlık
-        title = title_font.render("Giriş Yap", True, (255, 255, 255))
+        title = render_text(title_font, "Giriş Yap", (255, 255, 255))
         title_rect = title.get_rect(center=(screen_width//2, screen_height//4))
         screen.blit(title, title_rect)
         
@@ -686,8 +541,8 @@ def draw_modern_login_screen():
         pygame.draw.rect(screen, register_color, register_button, border_radius=25)
         
         # Buton metinleri
-        login_text = button_font.render("Giriş", True, (255, 255, 255))
-        register_text = button_font.render("Kayıt Ol", True, (255, 255, 255))
+        login_text = render_text(button_font, "Giriş", (255, 255, 255))
+        register_text = render_text(button_font, "Kayıt Ol", (255, 255, 255))
         
         # Buton metinlerini ortala
         login_text_rect = login_text.get_rect(center=login_button.center)
@@ -698,7 +553,7 @@ def draw_modern_login_screen():
                                    
         # Hata mesajı (eğer varsa)
         if hasattr(game_state, 'error_message') and game_state.error_message:
-            error_text = button_font.render(game_state.error_message, True, (231, 76, 60))
+            error_text = render_text(button_font, game_state.error_message, (231, 76, 60))
             error_rect = error_text.get_rect(center=(screen_width//2, screen_height//2 + 240))
             screen.blit(error_text, error_rect)
             
@@ -707,22 +562,11 @@ def draw_modern_login_screen():
 
 def draw_modern_register_screen():
     try:
-        # Arka plan
-        try:
-            background = pygame.image.load("images/arka_plan.jpg")
-            background = pygame.transform.scale(background, (screen_width, screen_height))
-            screen.blit(background, (0, 0))
-        except:
-            screen.fill((44, 62, 80))  # Koyu mavi
-        
-        # Yarı saydam overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        # Arka plan ve yarı saydam overlay (önceden birleştirilmiş)
+        screen_composer.draw_background(screen, "images/arka_plan.jpg", 128, (44, 62, 80))
         
         # Başlık
-        title = title_font.render("Kayıt Ol", True, (255, 255, 255))
+        title = render_text(title_font, "Kayıt Ol", (255, 255, 255))
         title_rect = title.get_rect(center=(screen_width//2, screen_height//4))
         screen.blit(title, title_rect)
         
@@ -747,8 +591,8 @@ def draw_modern_register_screen():
         pygame.draw.rect(screen, back_color, back_button, border_radius=20)
         
         # Buton metinleri
-        register_text = button_font.render("Kayıt Ol", True, (255, 255, 255))
-        back_text = button_font.render("Geri", True, (255, 255, 255))
+        register_text = render_text(button_font, "Kayıt Ol", (255, 255, 255))
+        back_text = render_text(button_font, "Geri", (255, 255, 255))
         
         # Buton metinlerini ortala
         register_text_rect = register_text.get_rect(center=register_button.center)
@@ -759,7 +603,7 @@ def draw_modern_register_screen():
                                
         # Hata mesajı (eğer varsa)
         if hasattr(game_state, 'error_message') and game_state.error_message:
-            error_text = button_font.render(game_state.error_message, True, (231, 76, 60))
+            error_text = render_text(button_font, game_state.error_message, (231, 76, 60))
             error_rect = error_text.get_rect(center=(screen_width//2, screen_height//2 + 240))
             screen.blit(error_text, error_rect)
             
@@ -855,42 +699,40 @@ class GameOverMenu:
             "button_hover": (41, 128, 185),
             "text": (255, 255, 255)
         }
+        self.title_font = get_font(74)
+        self.button_font = get_font(36)
         self.buttons = {
-            "restart": {
-                "rect": pygame.Rect(screen_width//2 - 150, screen_height//2, 300, 50),
-                "text": "Tekrar Başla",
-                "color": self.colors["button"]
-            },
-            "menu": {
-                "rect": pygame.Rect(screen_width//2 - 150, screen_height//2 + 70, 300, 50),
-                "text": "Ana Menüye Dön",
-                "color": self.colors["button"]
-            }
+            "restart": Button(
+                pygame.Rect(screen_width//2 - 150, screen_height//2, 300, 50),
+                "Tekrar Başla", self.button_font, self.colors["button"], self.colors["text"],
+                hover_color=self.colors["button_hover"]
+            ),
+            "menu": Button(
+                pygame.Rect(screen_width//2 - 150, screen_height//2 + 70, 300, 50),
+                "Ana Menüye Dön", self.button_font, self.colors["button"], self.colors["text"],
+                hover_color=self.colors["button_hover"]
+            )
         }
-        self.title_font = pygame.font.Font(None, 74)
-        self.button_font = pygame.font.Font(None, 36)
+        self.background = load_image("Assests/gameover_success.png", (screen_width, screen_height))
         
-    def draw(self, score):
-        try:
-            # Arka plan resmi
-            background_img = pygame.image.load("C:\\ziplayan_tavsan\\Oyun\\Assests\\gameover_success.png")
-            background_img = pygame.transform.scale(background_img, (self.screen_width, self.screen_height))
-            self.screen.blit(background_img, (0, 0))
-        except Exception as e:
-            print(f"Arka plan resmi yüklenemedi: {e}")
-            # Arka plan yüklenemezse yarı saydam siyah arka plan
-            overlay = pygame.Surface((self.screen_width, self.screen_height))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(200)
+    def draw_background(self):
+        """Arka plan resmi; yüklenemezse oyun ekranının üstüne yarı saydam siyah"""
+        if self.background:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            overlay = screen_composer.get_overlay((self.screen_width, self.screen_height), 200)
             self.screen.blit(overlay, (0, 0))
+            
+    def draw(self, score):
+        self.draw_background()
         
         # Oyun Bitti yazısı
-        title = self.title_font.render("OYUN BİTTİ", True, self.colors["text"])
+        title = render_text(self.title_font, "OYUN BİTTİ", self.colors["text"])
         title_rect = title.get_rect(center=(self.screen_width//2, self.screen_height//3))
         self.screen.blit(title, title_rect)
         
         # Skor
-        score_text = self.button_font.render(f"Skor: {score}", True, self.colors["text"])
+        score_text = render_text(self.button_font, f"Skor: {score}", self.colors["text"])
         score_rect = score_text.get_rect(center=(self.screen_width//2, self.screen_height//2 - 50))
         self.screen.blit(score_text, score_rect)
         
@@ -898,31 +740,20 @@ class GameOverMenu:
         self._draw_buttons()
 
     def draw_win_screen(self, score):
-        try:
-            # Arka plan resmi
-            background_img = pygame.image.load("C:\\ziplayan_tavsan\\Oyun\\Assests\\gameover_success.png")
-            background_img = pygame.transform.scale(background_img, (self.screen_width, self.screen_height))
-            self.screen.blit(background_img, (0, 0))
-        except Exception as e:
-            print(f"Arka plan resmi yüklenemedi: {e}")
-            # Arka plan yüklenemezse yarı saydam siyah arka plan
-            overlay = pygame.Surface((self.screen_width, self.screen_height))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(200)
-            self.screen.blit(overlay, (0, 0))
+        self.draw_background()
         
         # Kazandınız yazısı
-        title = self.title_font.render("KAZANDINIZ!", True, (46, 204, 113))  # Yeşil renk
+        title = render_text(self.title_font, "KAZANDINIZ!", (46, 204, 113))  # Yeşil renk
         title_rect = title.get_rect(center=(self.screen_width//2, self.screen_height//3))
         self.screen.blit(title, title_rect)
         
         # Tebrik mesajı
-        congrats = self.button_font.render("Tüm seviyeleri başarıyla tamamladınız!", True, self.colors["text"])
+        congrats = render_text(self.button_font, "Tüm seviyeleri başarıyla tamamladınız!", self.colors["text"])
         congrats_rect = congrats.get_rect(center=(self.screen_width//2, self.screen_height//2 - 80))
         self.screen.blit(congrats, congrats_rect)
         
         # Skor
-        score_text = self.button_font.render(f"Final Skor: {score}", True, self.colors["text"])
+        score_text = render_text(self.button_font, f"Final Skor: {score}", self.colors["text"])
         score_rect = score_text.get_rect(center=(self.screen_width//2, self.screen_height//2 - 30))
         self.screen.blit(score_text, score_rect)
         
@@ -932,17 +763,13 @@ class GameOverMenu:
     def _draw_buttons(self):
         # Butonları çiz
         mouse_pos = pygame.mouse.get_pos()
-        for button_name, button in self.buttons.items():
-            color = self.colors["button_hover"] if button["rect"].collidepoint(mouse_pos) else button["color"]
-            pygame.draw.rect(self.screen, color, button["rect"], border_radius=10)
-            
-            text = self.button_font.render(button["text"], True, self.colors["text"])
-            text_rect = text.get_rect(center=button["rect"].center)
-            self.screen.blit(text, text_rect)
+        for button in self.buttons.values():
+            button.update(mouse_pos)
+            button.draw(self.screen)
             
     def handle_click(self, pos):
         for button_name, button in self.buttons.items():
-            if button["rect"].collidepoint(pos):
+            if button.is_clicked(pos):
                 return button_name
         return None
 
@@ -961,21 +788,60 @@ try:
     block_manager = BlockManager(screen_width)
     power_up_manager = PowerUpManager()
     level_system = LevelSystem(screen_width, screen_height)
+    level_system.prefetch_level_assets(1, block_manager)  # Menüdeyken ilk seviyeyi hazırla
     game_logic = GameLogic(screen_width, screen_height)
     menu = ModernMenu(screen, screen_width, screen_height)
     leaderboard = Leaderboard(screen, screen_width, screen_height)
     settings_menu = GameSettings(screen, screen_width, screen_height, db)
     profile_menu = Profile(screen, screen_width, screen_height)
     settings_menu.set_game_state(game_state)  # GameState'i settings_menu'ye ekle
+    
+    # Oyun ekranı için statik katman ve kirli dikdörtgen çizici
+    static_layer = StaticLayer(screen_width, screen_height)
+    game_renderer = DirtyRectRenderer(render_target, static_layer)
+    use_dirty_rects = settings_menu.settings_manager.get_setting("graphics", "dirty_rect_rendering")
+    
+    # Blok kırılma, patlama ve joker toplama parçacıkları
+    particle_system = ParticleSystem(screen_width, screen_height)
+    particle_system.enabled = settings_menu.settings_manager.get_setting("graphics", "particle_effects")
+    game_logic.particles = particle_system
+    power_up_manager.particles = particle_system
+    
+    # Sabit adımlı simülasyon ve çizimde ara değerlenen konumlar
+    timestep = FixedTimestep(settings_menu.settings_manager.get_setting("performance", "simulation_rate"))
+    timestep.track(lambda: [ball], ("x", "y"))
+    timestep.track(lambda: [power_up_manager.extra_balls], ("live_pos",))
+    timestep.track(lambda: [platform.rect] + [b.rect for b in block_manager.kinematics.blocks], ("x",))
+    timestep.track(lambda: [p["rect"] for p in power_up_manager.power_ups], ("y",))
+    timestep.track(lambda: [platform.lasers], ("live_y",))
+    
+    # Kare süresine göre görsel kaliteyi ayarlayan yönetici
+    frame_governor = FrameGovernor.from_settings(settings_menu.settings_manager)
 except Exception as e:
     print(f"Oyun başlatılırken hata: {e}")
     pygame.quit()
     sys.exit(1)
 
+def apply_quality():
+    """Kare yöneticisinin kalite kararlarını uygula"""
+    for button in menu.buttons.values():
+        button.glow_enabled = frame_governor.get("menu_glow")
+    particle_system.count_scale = frame_governor.get("particle_scale")
+
+# Başlangıç kalitesini ilk karede uygula
+apply_quality()
+
 while running:
     try:
-        # FPS sınırı
-        clock.tick(60)
+        # FPS sınırı (kare yöneticisinin bütçesiyle aynı hedef)
+        frame_ms = clock.tick(frame_governor.target_fps)
+        
+        # Bekleme hariç kare süresini ölç, gerekirse kaliteyi değiştir
+        if frame_governor.update(clock.get_rawtime()):
+            apply_quality()
+        
+        # Arka planda çözülen görselleri ekran formatına dönüştür
+        asset_manager.collect()
         
         # Fare pozisyonunu al
         mouse_pos = pygame.mouse.get_pos()
@@ -990,6 +856,10 @@ while running:
                     db.close()
                 running = False
                 
+            # Pencere yeniden göründüğünde tüm ekranı çiz
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game_renderer.invalidate()
+                
             # Game over ekranı için buton kontrolleri
             if game_state.state == "game_over" and event.type == pygame.MOUSEBUTTONDOWN:
                 action = game_over_menu.handle_click(event.pos)
@@ -1005,8 +875,7 @@ while running:
                     if game_state.is_logged_in():
                         db.update_high_score(game_state.current_user['username'], game_state.score)
                     game_state.change_state("menu")
-                    if sounds.get("menu_music"):
-                        sounds["menu_music"].play(-1)
+                    sound_bank.play("menu_music", loops=-1)
                 
             # Oyun kazanma ekranı için buton kontrolleri
             if game_state.state == "game_won" and event.type == pygame.MOUSEBUTTONDOWN:
@@ -1023,8 +892,7 @@ while running:
                     if game_state.is_logged_in():
                         db.update_high_score(game_state.current_user['username'], game_state.score)
                     game_state.change_state("menu")
-                    if sounds.get("menu_music"):
-                        sounds["menu_music"].play(-1)
+                    sound_bank.play("menu_music", loops=-1)
                 
             # Input box'lar için event handling
             if game_state.state in ["login", "register"]:
@@ -1047,6 +915,15 @@ while running:
                         game_state.paused = not game_state.paused
                     elif game_state.state != "menu":
                         game_state.change_state("menu")
+                elif event.key == pygame.K_F3:
+                    # Kare yöneticisi debug ekranı
+                    frame_governor.show_overlay = not frame_governor.show_overlay
+                elif event.key == pygame.K_F4 and frame_governor.show_overlay and game_state.state == "game":
+                    # Debug: yüzlerce ekstra topla stres testi
+                    power_up_manager.activate_power_up("chaos_ball", platform, ball)
+                elif event.key == pygame.K_F5 and frame_governor.show_overlay and game_state.state == "game":
+                    # Debug: seri lazerle stres testi
+                    power_up_manager.activate_power_up("rapid_laser", platform, ball)
                         
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if game_state.state == "menu":
@@ -1099,84 +976,91 @@ while running:
                     except Exception as e:
                         game_state.set_error(f"Ayarlar hatası: {str(e)}")
         
-        # Oyun mantığı
+        # Oyun mantığı (çizimden bağımsız, sabit adımlarla)
         if game_state.state == "game" and not game_state.paused:
-            try:
-                # Oyun girdilerini işle
-                handle_game_input()
+            for _ in range(timestep.advance(frame_ms)):
+                timestep.save_state()
+                try:
+                    # Oyun girdilerini işle
+                    handle_game_input(timestep.dt)
                 
-                # Oyun nesnelerini güncelle
-                if ball.active:
-                    ball.move()
-                    
-                # Çarpışma kontrolleri ve skor güncellemesi
-                new_score = game_logic.check_collisions(ball, platform, block_manager, power_up_manager, game_state)
-                if new_score > game_state.score:
-                    game_state.score = new_score
-                    if "score" in sounds:
-                        sounds["score"].play()
+                    # Top hareketi, tek çarpışma geçişi ve olaylardan skor/ses/power-up
+                    game_logic.update(ball, platform, block_manager, power_up_manager, game_state,
+                                      timestep.dt)
+                
+                    # Power-up güncelleme
+                    power_up_manager.update(platform, ball, timestep.dt)
                 
-                # Power-up güncelleme
-                power_up_manager.update(platform, ball)
+                    # Blok güncellemeleri
+                    block_manager.update(timestep.dt)
                 
-                # Blok güncellemeleri
-                block_manager.update()
+                    # Parçacık güncellemeleri
+                    particle_system.update(timestep.dt)
                 
-                # Level kontrolü
-                if level_system.is_level_complete(block_manager):
-                    game_state.level += 1
-                    print(f"Yeni seviye: {game_state.level}")
+                    # Level kontrolü
+                    if level_system.is_level_complete(block_manager):
+                        game_state.level += 1
+                        print(f"Yeni seviye: {game_state.level}")
                     
-                    # Oyun tamamlandı mı kontrol et
-                    if level_system.is_game_complete(game_state.level):
-                        # Oyun kazanıldı
-                        if "level_up" in sounds:
-                            sounds["level_up"].play()
-                        game_state.change_state("game_won")
-                    else:
-                        # Sonraki seviyeye geç
-                        # Oyun nesnelerini sıfırla
-                        ball.reset()
-                        platform.reset()
+                        # Oyun tamamlandı mı kontrol et
+                        if level_system.is_game_complete(game_state.level):
+                            # Oyun kazanıldı
+                            sound_bank.play("level_up")
+                            game_state.change_state("game_won")
+                        else:
+                            # Sonraki seviyeye geç
+                            # Oyun nesnelerini sıfırla
+                            ball.reset()
+                            platform.reset()
                         
-                        # Yeni level için arkaplanı güncelle
-                        global current_background
-                        current_background = level_system.load_level_assets(game_state.level, platform)
-                        print(f"Yeni arkaplan yüklendi: {current_background is not None}")
+                            # Yeni level için arkaplanı güncelle
+                            global current_background
+                            current_background = level_system.load_level_assets(game_state.level, platform)
+                            level_system.prefetch_level_assets(game_state.level + 1, block_manager)
+                            print(f"Yeni arkaplan yüklendi: {current_background is not None}")
                         
-                        # Level tasarımını yükle
-                        level_data = level_system.get_level_layout(game_state.level, block_manager)
-                        ball.speed = level_data["ball_speed"]
+                            # Level tasarımını yükle
+                            level_data = level_system.get_level_layout(game_state.level, block_manager)
+                            ball.speed = level_data["ball_speed"]
                         
-                        # Level up sesini çal
-                        if "level_up" in sounds:
-                            sounds["level_up"].play()
+                            # Level up sesini çal
+                            sound_bank.play("level_up")
                         
-                        # Power-up'ları temizle
-                        power_up_manager.power_ups.clear()
-                        power_up_manager.active_effects.clear()
-                    
-                # Çarpışma kontrolleri ve skor güncellemesi
-                new_score = game_logic.check_collisions(ball, platform, block_manager, power_up_manager, game_state)
-                if new_score > game_state.score:
-                    game_state.score = new_score
-                    if "score" in sounds:
-                        sounds["score"].play()
+                            # Power-up'ları temizle
+                            power_up_manager.power_ups.clear()
+                            power_up_manager.active_effects.clear()
                 
-                # Yapışkan platform kontrolü
-                if platform.sticky and ball.active:
-                    ball.attach_to_platform(platform)
+                    # Yapışkan platform kontrolü
+                    if platform.sticky and ball.active:
+                        ball.attach_to_platform(platform)
+                    
+                except Exception as e:
+                    game_state.set_error(f"Oyun hatası: {str(e)}")
                     
-            except Exception as e:
-                game_state.set_error(f"Oyun hatası: {str(e)}")
+                # Oyun ekranından çıkıldıysa kalan adımları çalıştırma
+                if game_state.state != "game":
+                    break
                 
             # Menü tuşu kontrolü
             keys = pygame.key.get_pressed()
             if keys[pygame.K_m]:
                 game_state.change_state("menu")
+        else:
+            # Duraklatma/menü süresi simülasyona eklenmesin
+            timestep.reset()
+        
+        # Oyun ekranında sadece değişen bölgeler çizilir
+        dirty_frame = use_dirty_rects and game_state.state == "game" and not game_state.paused
+        if not dirty_frame:
+            game_renderer.invalidate()
+            
+            # Ekranı temizle
+            screen.fill(BLACK)
         
-        # Ekranı temizle
-        screen.fill(BLACK)
+        # Çizimde son iki simülasyon adımı arasındaki ara konumlar kullanılır
+        interpolated = []
+        if game_state.state == "game" and not game_state.paused:
+            interpolated = timestep.interpolate()
         
         # Duruma göre çizim
         try:
@@ -1194,23 +1078,36 @@ while running:
             elif game_state.state == "settings":
                 settings_menu.draw()
                 
+            elif dirty_frame:
+                background = current_background if 'current_background' in globals() else None
+                game_renderer.draw_scene(background, platform, ball, block_manager, power_up_manager,
+                                         particle_system)
+                
+                # HUD (Heads-Up Display)
+                score_text = render_text(default_font, f"Skor: {game_state.score}", WHITE)
+                level_text = render_text(default_font, f"Level: {game_state.level}", WHITE)
+                lives_text = render_text(default_font, f"Can: {game_state.lives}", WHITE)
+                
+                game_renderer.mark(screen.blit(score_text, (10, 10)))
+                game_renderer.mark(screen.blit(level_text, (screen_width - 100, 10)))
+                game_renderer.mark(screen.blit(lives_text, (10, screen_height - 30)))
+                
             elif game_state.state == "game":
-                # Önce arkaplanı çiz
-                if 'current_background' in globals() and current_background is not None:
-                    screen.blit(current_background, (0, 0))
-                else:
-                    screen.fill((44, 62, 80))  # yedek koyu mavi arka plan
+                # Önce arkaplan ve hareketsiz bloklar (önbelleklenmiş katman)
+                background = current_background if 'current_background' in globals() else None
+                static_layer.update(background, block_manager)
+                static_layer.draw(screen, block_manager)
                 
                 # Oyun nesnelerini çiz
                 platform.draw(screen)
                 ball.draw(screen)
-                block_manager.draw(screen)
                 power_up_manager.draw(screen)
+                particle_system.draw(screen)
                 
                 # HUD (Heads-Up Display)
-                score_text = default_font.render(f"Skor: {game_state.score}", True, WHITE)
-                level_text = default_font.render(f"Level: {game_state.level}", True, WHITE)
-                lives_text = default_font.render(f"Can: {game_state.lives}", True, WHITE)
+                score_text = render_text(default_font, f"Skor: {game_state.score}", WHITE)
+                level_text = render_text(default_font, f"Level: {game_state.level}", WHITE)
+                lives_text = render_text(default_font, f"Can: {game_state.lives}", WHITE)
                 
                 screen.blit(score_text, (10, 10))
                 screen.blit(level_text, (screen_width - 100, 10))
@@ -1218,15 +1115,17 @@ while running:
                 
                 # Duraklatma menüsü
                 if game_state.paused:
-                    # Yarı saydam siyah overlay
-                    overlay = pygame.Surface((screen_width, screen_height))
-                    overlay.fill((0, 0, 0))
-                    overlay.set_alpha(128)
-                    screen.blit(overlay, (0, 0))
+                    pause_text = render_text(default_font, "OYUN DURAKLATILDI", WHITE)
+                    continue_text = render_text(default_font, "Devam etmek için ESC'ye basın", WHITE)
+                    menu_text = render_text(default_font, "Ana menüye dönmek için M'ye basın", WHITE)
                     
-                    pause_text = default_font.render("OYUN DURAKLATILDI", True, WHITE)
-                    continue_text = default_font.render("Devam etmek için ESC'ye basın", True, WHITE)
-                    menu_text = default_font.render("Ana menüye dönmek için M'ye basın", True, WHITE)
+                    if frame_governor.get("pause_overlay_alpha"):
+                        # Yarı saydam siyah overlay
+                        screen.blit(screen_composer.get_overlay((screen_width, screen_height), 128), (0, 0))
+                    else:
+                        # Sadece yazıların arkasına düz panel
+                        panel_width = max(menu_text.get_width(), continue_text.get_width()) + 40
+                        screen.fill(BLACK, (screen_width//2 - panel_width//2, screen_height//2 - 80, panel_width, 160))
                     
                     screen.blit(pause_text, (screen_width//2 - pause_text.get_width()//2, screen_height//2 - 60))
                     screen.blit(continue_text, (screen_width//2 - continue_text.get_width()//2, screen_height//2))
@@ -1246,15 +1145,28 @@ while running:
                 
             # Hata mesajını göster
             if game_state.error_message:
-                error_text = button_font.render(game_state.error_message, True, RED)
+                error_text = render_text(button_font, game_state.error_message, RED)
                 error_rect = error_text.get_rect(center=(screen_width // 2, screen_height - 30))
                 screen.blit(error_text, error_rect)
+                if dirty_frame:
+                    game_renderer.mark(error_rect)
+                    
+            # Kare yöneticisi debug ekranı
+            if frame_governor.show_overlay:
+                overlay_rect = frame_governor.draw_overlay(screen)
+                if dirty_frame:
+                    game_renderer.mark(overlay_rect)
                 
         except Exception as e:
             print(f"Çizim hatası: {e}")
             
+        timestep.restore(interpolated)
+            
         # Ekranı güncelle
-        pygame.display.flip()
+        if dirty_frame:
+            game_renderer.present()
+        else:
+            render_target.present()
         
     except Exception as e:
         print(f"Ana döngü hatası: {e}")
@@ -0,0 +1,153 @@
+import math
+import numpy as np
+import pygame
+
+class ParticleSystem:
+    """Sabit kapasiteli, NumPy dizilerinde tutulan parçacık havuzu.
+
+    Canlı parçacıklar dizilerin başında [0, count) aralığında sıkışık tutulur;
+    yeni parçacıklar için bellek ayrılmaz, kapasite dolunca fazlası atılır.
+    """
+    def __init__(self, screen_width, screen_height, capacity=4096, dot_size=4,
+                 max_colors=32, cell_size=32):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.capacity = capacity
+        self.dot_size = dot_size
+        self.max_colors = max_colors
+        self.cell_size = cell_size  # Kirli alan hesabı için ızgara boyutu
+
+        # Parçacık dizileri
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # Kalan kare sayısı
+        self.color = np.zeros(capacity, dtype=np.int16)  # Renk paleti indeksi
+        self.screen_pos = np.zeros((capacity, 2), dtype=np.int32)  # Sprite'ların sol üst köşeleri
+        self.count = 0
+
+        # Kirli alan hesabı için dolu hücre tablosu
+        self.grid_cols = screen_width // cell_size + 1
+        self.grid_rows = screen_height // cell_size + 1
+        self.occupied = np.zeros(self.grid_cols * self.grid_rows, dtype=bool)
+
+        self.gravity = 0.15
+        self.enabled = True  # graphics.particle_effects ayarı
+        self.count_scale = 1.0  # Kare yöneticisinin parçacık oranı
+
+        # Renk paleti ve önceden çizilmiş nokta sprite'ları
+        self.palette = []
+        self.sprites = []
+        self.color_indexes = {}
+        self.rng = np.random.default_rng()
+
+    def get_color_index(self, color):
+        """Renk için nokta sprite'ının indeksini döndür (gerekirse oluştur)"""
+        color = tuple(color[:3])
+        index = self.color_indexes.get(color)
+        if index is not None:
+            return index
+
+        if len(self.palette) >= self.max_colors:
+            # Palet dolu, en yakın rengi kullan
+            index = min(range(len(self.palette)),
+                        key=lambda i: sum((a - b) ** 2 for a, b in zip(self.palette[i], color)))
+        else:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.sprites.append(self.create_sprite(color))
+        self.color_indexes[color] = index
+        return index
+
+    def create_sprite(self, color):
+        # Renk anahtarlı (RLE) küçük nokta, alfa karışımından daha hızlı çizilir
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        sprite = pygame.Surface((self.dot_size, self.dot_size))
+        sprite.fill(key)
+        radius = self.dot_size / 2
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, color, amount=12, speed=3.0, life=30):
+        """(x, y) noktasından her yöne saçılan parçacıklar oluştur"""
+        return self.emit_many([(x, y)], color, amount, speed, life)
+
+    def emit_many(self, points, color, amount=12, speed=3.0, life=30):
+        """Birden çok noktanın her birinden amount parçacık saç (tek seferde)"""
+        if not self.enabled or not points:
+            return 0
+        per_point = int(amount * self.count_scale)
+        amount = min(per_point * len(points), self.capacity - self.count)
+        if amount <= 0:
+            return 0
+
+        start, end = self.count, self.count + amount
+        angles = self.rng.uniform(0, 2 * math.pi, amount)
+        speeds = self.rng.uniform(0.3, 1.0, amount) * speed
+        self.pos[start:end] = np.repeat(np.asarray(points, dtype=np.float32), per_point, axis=0)[:amount]
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.life[start:end] = self.rng.uniform(0.5, 1.0, amount) * life
+        self.color[start:end] = self.get_color_index(color)
+        self.count = end
+        return amount
+
+    def emit_rect(self, rect, color, amount=12, speed=3.0, life=30):
+        """Bir dikdörtgenin (kırılan blok vb.) merkezinden parçacık saç"""
+        return self.emit(rect.centerx, rect.centery, color, amount, speed, life)
+
+    def update(self, dt=1.0):
+        """Tüm parçacıkları tek seferde ilerlet ve ölenleri at"""
+        n = self.count
+        if n == 0:
+            return
+        pos, vel, life = self.pos[:n], self.vel[:n], self.life[:n]
+        pos += vel * dt
+        vel[:, 1] += self.gravity * dt
+        life -= dt
+
+        # Süresi dolan veya ekrandan çıkan parçacıkları at, kalanları sıkıştır
+        alive = ((life > 0) & (pos[:, 0] >= 0) & (pos[:, 0] < self.screen_width) &
+                 (pos[:, 1] < self.screen_height))
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            self.pos[:alive_count] = pos[alive]
+            self.vel[:alive_count] = vel[alive]
+            self.life[:alive_count] = life[alive]
+            self.color[:alive_count] = self.color[:n][alive]
+            self.count = alive_count
+
+    def get_positions(self):
+        """Sprite'ların sol üst köşe koordinatları (önceden ayrılmış dizide)"""
+        n = self.count
+        np.copyto(self.screen_pos[:n], self.pos[:n] - self.dot_size / 2, casting="unsafe")
+        return self.screen_pos[:n]
+
+    def draw(self, screen):
+        if self.count == 0:
+            return
+        positions = self.get_positions().tolist()
+        sprites = map(self.sprites.__getitem__, self.color[:self.count].tolist())
+        screen.blits(zip(sprites, positions), doreturn=False)
+
+    def get_draw_rects(self):
+        """Parçacıkların kapladığı ızgara hücreleri (binlerce küçük alan yerine)"""
+        if self.count == 0:
+            return []
+        cell = self.cell_size
+        positions = self.get_positions()
+        cols = np.clip(positions[:, 0] // cell, 0, self.grid_cols - 1)
+        rows = np.clip(positions[:, 1] // cell, 0, self.grid_rows - 1)
+        self.occupied[:] = False
+        self.occupied[rows * self.grid_cols + cols] = True
+        size = cell + self.dot_size
+        return [pygame.Rect((i % self.grid_cols) * cell, (i // self.grid_cols) * cell, size, size)
+                for i in np.flatnonzero(self.occupied).tolist()]
+
+    def get_stats(self):
+        return {"count": self.count, "capacity": self.capacity, "colors": len(self.palette)}
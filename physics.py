@@ -0,0 +1,89 @@
+import math
+import numpy as np
+
+def reflect(dx, dy, normal):
+    """Hız vektörünü temas normaline göre yansıt"""
+    nx, ny = normal
+    dot = dx * nx + dy * ny
+    return dx - 2 * dot * nx, dy - 2 * dot * ny
+
+def paddle_bounce(x, dx, dy, rect):
+    """Platformdaki çarpma noktasına göre yukarı doğru yeni hız.
+
+    45° ile 135° arası açı, hız korunur; x, dx, dy NumPy dizisi de olabilir.
+    """
+    hit_point = (x - rect.x) / rect.width
+    bounce_angle = np.pi * (0.25 + 0.5 * hit_point)
+    speed = np.hypot(dx, dy)
+    return speed * np.cos(bounce_angle), -np.abs(speed * np.sin(bounce_angle))
+
+def block_normal(x, y, rect):
+    """Bloğa örtüşerek değen topun temas normali (bloğun merkezine göre)"""
+    dx = x - rect.centerx
+    dy = y - rect.centery
+    if abs(dx / rect.width) > abs(dy / rect.height):
+        return (1 if dx > 0 else -1, 0)
+    return (0, 1 if dy > 0 else -1)
+
+def sweep_circle_rect(x, y, dx, dy, radius, rect):
+    """(x, y) merkezli daire (dx, dy) boyunca ilerlerken dikdörtgene ilk değme anı.
+
+    Değme varsa (t, (nx, ny)) döndürür; t hareketin [0, 1] aralığındaki oranı,
+    normal ise temas noktasındaki birim yüzey normalidir. Daire zaten
+    dikdörtgenle iç içeyse None döner.
+    """
+    # Yarıçap kadar genişletilmiş kutuya karşı ışın testi (slab yöntemi)
+    t_near = -math.inf
+    t_far = math.inf
+    normal = None
+    for p, d, low, high, axis in ((x, dx, rect.left - radius, rect.right + radius, 0),
+                                  (y, dy, rect.top - radius, rect.bottom + radius, 1)):
+        if d == 0:
+            if p < low or p > high:
+                return None
+            continue
+        if d > 0:
+            enter, leave, sign = (low - p) / d, (high - p) / d, -1
+        else:
+            enter, leave, sign = (high - p) / d, (low - p) / d, 1
+        if enter > t_near:
+            t_near = enter
+            normal = (sign, 0) if axis == 0 else (0, sign)
+        t_far = min(t_far, leave)
+
+    if t_near > t_far or t_near > 1 or t_far < 0 or normal is None:
+        return None
+
+    # Genişletilmiş kutunun köşesine denk geldiyse gerçek köşe dairesine karşı test et
+    # (daire kutunun köşe bölgesinde başlıyorsa henüz dikdörtgene değmiyor olabilir)
+    t_start = max(t_near, 0)
+    hit_x = x + dx * t_start
+    hit_y = y + dy * t_start
+    corner_x = rect.left if hit_x < rect.left else rect.right if hit_x > rect.right else None
+    corner_y = rect.top if hit_y < rect.top else rect.bottom if hit_y > rect.bottom else None
+    if corner_x is None or corner_y is None:
+        return (t_near, normal) if t_near >= 0 else None
+
+    fx, fy = x - corner_x, y - corner_y
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+    discriminant = b * b - 4 * a * c
+    if c < 0 or discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+    return t, ((x + dx * t - corner_x) / radius, (y + dy * t - corner_y) / radius)
+
+def sweep_circle_walls(x, y, dx, dy, radius, width):
+    """Sol, sağ ve üst duvarlara ilk değme anı: (t, normal) veya None"""
+    hits = []
+    if dx < 0 and x >= radius:
+        hits.append(((radius - x) / dx, (1, 0)))
+    elif dx > 0 and x <= width - radius:
+        hits.append(((width - radius - x) / dx, (-1, 0)))
+    if dy < 0 and y >= radius:
+        hits.append(((radius - y) / dy, (0, 1)))
+    hits = [hit for hit in hits if hit[0] <= 1]
+    return min(hits, key=lambda hit: hit[0]) if hits else None
@@ -1,17 +1,21 @@
 import pygame
 import random
-import math
 import os
-from game_objects import Ball
+from ball_system import BallSystem
+from font_cache import get_font, render_text
+from assets import load_image
+from sound_bank import sound_bank
 
 class PowerUpManager:
     def __init__(self):
         self.power_ups = []
         self.active_effects = {}
         self.fall_speed = 3
-        self.extra_balls = []
+        self.extra_balls = BallSystem()  # Çoklu top power-up'larının topları
         self.game_won = False
         self.game_lost = False
+        self.effect_rects = []  # Son çizilen efekt yazılarının alanları
+        self.particles = None  # Toplama efektleri için parçacık sistemi
         
         # Joker ikonları ve sesleri
         self.powerup_assets = {
@@ -41,6 +45,12 @@ class PowerUpManager:
             }
         }
         
+        # Toplama sesleri bir kez çözülüp "power_up_<tür>" olaylarına bağlanır
+        self.sound_events = {}
+        for power_type, assets in self.powerup_assets.items():
+            self.sound_events[power_type] = "power_up_" + power_type
+            sound_bank.bind(self.sound_events[power_type], assets["sound"], priority=3, max_voices=1)
+        
         # Power-up türleri ve özellikleri
         self.power_up_types = {
             "big_paddle": {
@@ -59,7 +69,16 @@ class PowerUpManager:
                 "color": (155, 89, 182),
                 "duration": 15000,
                 "icon": "⚈",
-                "description": "Çoklu Top"
+                "description": "Çoklu Top",
+                "balls": 2  # Ana topla beraber 3 top olacak
+            },
+            "chaos_ball": {
+                "color": (192, 57, 43),
+                "duration": 10000,
+                "icon": "✺",
+                "description": "Kaos Topu",
+                "balls": 200,
+                "debug": True  # Rastgele düşmez, sadece stres testi için (F4)
             },
             "laser": {
                 "color": (231, 76, 60),
@@ -67,6 +86,14 @@ class PowerUpManager:
                 "icon": "↯",
                 "description": "Lazer"
             },
+            "rapid_laser": {
+                "color": (255, 99, 72),
+                "duration": 6000,
+                "icon": "⇈",
+                "description": "Seri Lazer",
+                "cooldown": 80,  # Atışlar arası süre (ms)
+                "debug": True  # Rastgele düşmez, sadece stres testi için (F5)
+            },
             "sticky": {
                 "color": (52, 152, 219),
                 "duration": 10000,
@@ -81,8 +108,11 @@ class PowerUpManager:
             }
         }
         
+        # Bloklardan düşebilecek türler (debug türleri hariç)
+        self.drop_pool = [name for name, info in self.power_up_types.items() if not info.get("debug")]
+        
     def spawn_powerup(self, x, y):
-        power_up_type = random.choice(list(self.power_up_types.keys()))
+        power_up_type = random.choice(self.drop_pool)
         
         # İkon yolunu al
         icon_path = self.powerup_assets[power_up_type]["icon"] if power_up_type in self.powerup_assets else None
@@ -90,11 +120,11 @@ class PowerUpManager:
         # İkonu yükle ve boyutlandır
         icon = None
         if icon_path and os.path.exists(icon_path):
-            icon_img = pygame.image.load(icon_path)
-            icon = pygame.transform.scale(icon_img, (30, 30))  # Joker boyutu 30x30
+            icon = load_image(icon_path, (30, 30))  # Joker boyutu 30x30
         
         power_up = {
             "rect": pygame.Rect(x, y, 30, 30),
+            "y": float(y),  # Alt piksel konum
             "type": power_up_type,
             "color": self.power_up_types[power_up_type]["color"],
             "creation_time": pygame.time.get_ticks(),
@@ -102,16 +132,22 @@ class PowerUpManager:
         }
         self.power_ups.append(power_up)
         
-    def update(self, platform, ball):
+    def update(self, platform, ball, dt=1.0):
         current_time = pygame.time.get_ticks()
         
+        # Ekstra topları hareket ettir
+        self.extra_balls.move(dt)
+        
         # Power-up'ları güncelle
         for power_up in self.power_ups[:]:
-            power_up["rect"].y += self.fall_speed
+            power_up["y"] += self.fall_speed * dt
+            power_up["rect"].y = power_up["y"]
             
             # Platform ile çarpışma kontrolü
             if power_up["rect"].colliderect(platform.rect):
                 self.activate_power_up(power_up["type"], platform, ball)
+                if self.particles:
+                    self.particles.emit_rect(power_up["rect"], power_up["color"], amount=20)
                 self.power_ups.remove(power_up)
             
             # Ekrandan çıktı mı kontrolü
@@ -128,15 +164,8 @@ class PowerUpManager:
         duration = self.power_up_types[power_type]["duration"]
         
         # Ses çal
-        if power_type in self.powerup_assets:
-            s_path = self.powerup_assets[power_type].get("sound", None)
-            if s_path and os.path.exists(s_path):
-                try:
-                    sound_fx = pygame.mixer.Sound(s_path)
-                    sound_fx.set_volume(0.5)
-                    sound_fx.play()
-                except:
-                    print(f"Ses dosyası yüklenemedi: {s_path}")
+        if power_type in self.sound_events:
+            sound_bank.play(self.sound_events[power_type])
         
         # Önceki aynı türdeki efekti kaldır
         if power_type in self.active_effects:
@@ -162,37 +191,17 @@ class PowerUpManager:
             ball.rect.width = ball.radius * 2
             ball.rect.height = ball.radius * 2
             
-        elif power_type == "multi_ball":
-            # 3 top oluştur
-            if not hasattr(self, 'extra_balls'):
-                self.extra_balls = []
-            
-            # Mevcut topları temizle
+        elif power_type in ("multi_ball", "chaos_ball"):
+            # Mevcut topları temizle, ana topun konumundan rastgele açılarla yenilerini fırlat
             self.extra_balls.clear()
-            
-            # İki yeni top ekle
-            for _ in range(2):  # Ana topla beraber 3 top olacak
-                new_ball = Ball(ball.screen_width, ball.screen_height)
-                new_ball.radius = ball.radius
-                new_ball.speed = ball.speed
-                new_ball.x = ball.x
-                new_ball.y = ball.y
-                new_ball.dx = ball.dx
-                new_ball.dy = ball.dy
-                new_ball.active = True
-                new_ball.original_radius = ball.original_radius
-                
-                # Rastgele açılarla fırlat
-                angle = random.uniform(-3*math.pi/4, -math.pi/4)
-                new_ball.dx = math.cos(angle) * new_ball.speed
-                new_ball.dy = math.sin(angle) * new_ball.speed
+            self.extra_balls.spawn_burst(ball, self.power_up_types[power_type]["balls"])
                 
-                self.extra_balls.append(new_ball)
-                
-        elif power_type == "laser":
+        elif power_type in ("laser", "rapid_laser"):
             # Lazer özelliği aktif
             platform.has_laser = True
             platform.laser_damage = 1  # Tek vuruşluk hasar
+            if power_type == "rapid_laser":
+                platform.laser_cooldown = self.power_up_types[power_type]["cooldown"]
             
         elif power_type == "sticky":
             # Yapışkan platform
@@ -233,16 +242,19 @@ class PowerUpManager:
             ball.rect.width = ball.radius * 2
             ball.rect.height = ball.radius * 2
             
-        elif power_type == "multi_ball":
+        elif power_type in ("multi_ball", "chaos_ball"):
             # Rastgele bir topu seç ve diğerlerini kaldır
-            if hasattr(self, 'extra_balls') and len(self.extra_balls) > 0:
-                surviving_ball = random.choice(self.extra_balls)
-                self.extra_balls = [surviving_ball]
+            self.extra_balls.keep_random(1)
                 
-        elif power_type == "laser":
-            platform.has_laser = False
-            platform.laser_damage = 0
-            platform.lasers.clear()
+        elif power_type in ("laser", "rapid_laser"):
+            if power_type == "rapid_laser":
+                platform.laser_cooldown = platform.original_laser_cooldown
+            # Diğer lazer türü hala aktifse lazerler kalsın
+            other = "rapid_laser" if power_type == "laser" else "laser"
+            if other not in self.active_effects:
+                platform.has_laser = False
+                platform.laser_damage = 0
+                platform.lasers.clear()
             
         elif power_type == "sticky":
             platform.sticky = False
@@ -268,14 +280,14 @@ class PowerUpManager:
                 screen.blit(power_up["icon"], (power_up["rect"].x, power_up["rect"].y))
             else:
                 pygame.draw.rect(screen, power_up["color"], power_up["rect"], border_radius=5)
-                font = pygame.font.Font(None, 24)
-                icon = font.render(self.power_up_types[power_up["type"]]["icon"], True, (255, 255, 255))
+                icon = render_text(get_font(24), self.power_up_types[power_up["type"]]["icon"], (255, 255, 255))
                 icon_rect = icon.get_rect(center=power_up["rect"].center)
                 screen.blit(icon, icon_rect)
             
         # Aktif efektleri göster
+        self.effect_rects = []
         y_offset = 50
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         current_time = pygame.time.get_ticks()
         
         for power_type, effect_data in self.active_effects.items():
@@ -283,8 +295,8 @@ class PowerUpManager:
             power_info = self.power_up_types[power_type]
             
             text = f"{power_info['description']}: {remaining_time:.1f}s"
-            text_surface = font.render(text, True, power_info["color"])
-            screen.blit(text_surface, (10, y_offset))
+            text_surface = render_text(font, text, power_info["color"])
+            self.effect_rects.append(screen.blit(text_surface, (10, y_offset)))
             
             progress = (effect_data["end_time"] - current_time) / power_info["duration"]
             bar_width = 100
@@ -292,12 +304,19 @@ class PowerUpManager:
             pygame.draw.rect(screen, (100, 100, 100), (120, y_offset + 8, bar_width, bar_height))
             pygame.draw.rect(screen, power_info["color"], 
                            (120, y_offset + 8, int(bar_width * progress), bar_height))
+            self.effect_rects.append(pygame.Rect(120, y_offset + 8, bar_width, bar_height))
             
             y_offset += 30
             
         # Ekstra topları çiz
-        if hasattr(self, 'extra_balls'):
-            for extra_ball in self.extra_balls:
-                if extra_ball.active:
-                    extra_ball.move()  # Topları hareket ettir
-                    extra_ball.draw(screen)  # Topları çiz
\ No newline at end of file
+        self.extra_balls.draw(screen)
+                    
+    def get_draw_rects(self):
+        """Power-up'ların, efekt listesinin ve ekstra topların kapladığı alanları döndür"""
+        rects = [power_up["rect"].copy() for power_up in self.power_ups]
+        
+        # Son çizilen efekt listesi (yazı + süre çubuğu)
+        rects.extend(self.effect_rects)
+            
+        rects.extend(self.extra_balls.get_draw_rects())
+        return rects
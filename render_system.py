@@ -0,0 +1,162 @@
+import pygame
+
+def is_static_block(block):
+    """Kendiliğinden görünümü değişmeyen bloklar statik katmana çizilir"""
+    if block.moving:
+        return False
+    # Görseli olmayan gizemli blokların "?" işareti yanıp söner
+    return not (block.block_type == "mystery" and not block.image)
+
+class StaticLayer:
+    """Arka plan ve hareketsiz blokları tutan önbelleklenmiş katman"""
+    def __init__(self, screen_width, screen_height, fallback_color=(44, 62, 80)):
+        self.surface = pygame.Surface((screen_width, screen_height))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.rect = self.surface.get_rect()
+        self.fallback_color = fallback_color  # Arka plan yoksa kullanılacak renk
+        self.background = None
+        self.layout_version = None  # Katmanın çizildiği blok düzeni
+
+    def invalidate(self):
+        """Bir sonraki güncellemede katmanı baştan oluştur"""
+        self.layout_version = None
+
+    def restore(self, rect):
+        """Verilen bölgeyi arka plandan geri yükle"""
+        if self.background:
+            self.surface.blit(self.background, rect, rect)
+        else:
+            self.surface.fill(self.fallback_color, rect)
+
+    def update(self, background, block_manager):
+        """Hasarlı bölgeleri yeniden çiz.
+
+        Katman baştan oluşturulduysa None, aksi halde değişen alanların listesini döndürür.
+        """
+        if background is not self.background or block_manager.layout_version != self.layout_version:
+            self.background = background
+            self.layout_version = block_manager.layout_version
+            block_manager.damaged_rects.clear()
+            self.restore(self.rect)
+            block_manager.draw(self.surface, [b for b in block_manager.blocks if is_static_block(b)])
+            return None
+
+        if not block_manager.damaged_rects:
+            return []
+
+        # Bölgeyi değdiği blokları tamamen içine alacak şekilde büyüt,
+        # temizle ve blokları yeniden çiz (yarı saydam görseller üst üste binmesin)
+        static_blocks = [b for b in block_manager.blocks if is_static_block(b)]
+        block_rects = [b.rect for b in static_blocks]
+        updated = []
+        for rect in block_manager.damaged_rects:
+            rect = rect.clip(self.rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            hits = rect.collidelistall(block_rects)
+            while hits:
+                grown = rect.unionall([block_rects[i] for i in hits])
+                if grown == rect:
+                    break
+                rect = grown
+                hits = rect.collidelistall(block_rects)
+            self.restore(rect)
+            if hits:
+                block_manager.draw(self.surface, [static_blocks[i] for i in hits])
+            updated.append(rect)
+        block_manager.damaged_rects.clear()
+        return updated
+
+    def draw(self, screen, block_manager):
+        """Katmanı ve katmanda olmayan (hareketli) blokları ekrana çiz"""
+        screen.blit(self.surface, (0, 0))
+        block_manager.draw(screen, [b for b in block_manager.blocks if not is_static_block(b)])
+
+class RenderTarget:
+    """Oyunun çizildiği sabit mantıksal çözünürlüklü pencere.
+
+    Tüm sistemler 800x600 mantıksal koordinatlarda doğrudan ekran yüzeyine
+    çizer; pencere pygame.SCALED ile açıldığından gerçek pencere boyutuna
+    büyütme ve fare koordinatlarının dönüşümü SDL tarafından yapılır.
+    """
+    def __init__(self, logical_size, flags=pygame.SCALED):
+        self.logical_size = tuple(logical_size)
+        self.surface = pygame.display.set_mode(self.logical_size, flags)
+
+    def present(self, rects=None):
+        """Kareyi pencereye aktar (rects verilirse sadece o alanları)"""
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+class DirtyRectRenderer:
+    """Oyun ekranını sadece değişen bölgeleri güncelleyerek çizer"""
+    def __init__(self, render_target, static_layer):
+        self.render_target = render_target
+        self.screen = render_target.surface
+        self.screen_rect = self.screen.get_rect()
+        self.static_layer = static_layer  # Arka plan + hareketsiz bloklar
+
+        # Kare takibi
+        self.needs_full_redraw = True
+        self.prev_rects = []  # Önceki karede hareketli nesnelerin kapladığı alanlar
+        self.frame_rects = []  # Bu karede ekrana gönderilecek alanlar
+
+    def invalidate(self):
+        """Bir sonraki karede tüm ekranı yeniden çiz"""
+        self.needs_full_redraw = True
+
+    def draw_scene(self, background, platform, ball, block_manager, power_up_manager, particles=None):
+        """Oyun sahnesini çiz ve güncellenecek alanları topla"""
+        screen = self.screen
+        layer = self.static_layer
+        updated = layer.update(background, block_manager)
+        if updated is None:
+            self.needs_full_redraw = True
+
+        if self.needs_full_redraw:
+            # Tüm ekranı katmandan oluştur
+            screen.blit(layer.surface, (0, 0))
+            self.frame_rects = [self.screen_rect.copy()]
+        else:
+            # Sadece kirli bölgeleri katmandan geri yükle
+            self.frame_rects = []
+            for rect in self.prev_rects + updated:
+                rect = rect.clip(self.screen_rect)
+                if rect.width > 0 and rect.height > 0:
+                    screen.blit(layer.surface, rect, rect)
+                    self.frame_rects.append(rect)
+
+        # Hareketli nesneler
+        dynamic_blocks = [b for b in block_manager.blocks if not is_static_block(b)]
+        block_manager.draw(screen, dynamic_blocks)
+        platform.draw(screen)
+        ball.draw(screen)
+        power_up_manager.draw(screen)
+        if particles:
+            particles.draw(screen)
+
+        self.prev_rects = [b.rect.copy() for b in dynamic_blocks]
+        self.prev_rects += (platform.get_draw_rects() + ball.get_draw_rects() +
+                            power_up_manager.get_draw_rects())
+        if particles:
+            self.prev_rects += particles.get_draw_rects()
+        self.frame_rects.extend(self.prev_rects)
+
+    def mark(self, rect):
+        """Sahne dışında çizilen bir alanı (HUD vb.) takibe ekle"""
+        if rect:
+            self.prev_rects.append(rect)
+            self.frame_rects.append(rect)
+        return rect
+
+    def present(self):
+        """Değişen alanları ekrana gönder"""
+        if self.needs_full_redraw:
+            self.render_target.present()
+            self.needs_full_redraw = False
+        else:
+            self.render_target.present(self.frame_rects)
+        self.frame_rects = []
@@ -0,0 +1,48 @@
+import pygame
+from assets import load_image
+
+class ScreenComposer:
+    """Menü ekranlarının arka plan + karartma katmanlarını bir kez oluşturup saklar"""
+    def __init__(self):
+        self.backgrounds = {}  # (yol, boyut, alpha, yedek renk) -> hazır arka plan
+        self.overlays = {}  # (boyut, alpha, renk) -> karartma yüzeyi
+
+    def get_overlay(self, size, alpha, color=(0, 0, 0)):
+        """Yarı saydam karartma yüzeyini döndür"""
+        key = (tuple(size), alpha, tuple(color))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            self.overlays[key] = overlay
+        return overlay
+
+    def get_background(self, image_path, size, overlay_alpha=128, fallback_color=(44, 62, 80)):
+        """Arka plan görseli ve karartmanın birleştirilmiş halini döndür"""
+        key = (image_path, tuple(size), overlay_alpha, tuple(fallback_color))
+        background = self.backgrounds.get(key)
+        if background is None:
+            background = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                background = background.convert()
+
+            image = load_image(image_path, tuple(size)) if image_path else None
+            if image:
+                background.blit(image, (0, 0))
+            else:
+                background.fill(fallback_color)
+
+            if overlay_alpha:
+                background.blit(self.get_overlay(size, overlay_alpha), (0, 0))
+            self.backgrounds[key] = background
+        return background
+
+    def draw_background(self, screen, image_path, overlay_alpha=128, fallback_color=(44, 62, 80)):
+        """Hazır arka planı ekrana çiz"""
+        screen.blit(self.get_background(image_path, screen.get_size(), overlay_alpha, fallback_color), (0, 0))
+
+# Tüm menülerin paylaştığı ekran birleştirici
+screen_composer = ScreenComposer()
@@ -37,7 +37,8 @@ class Settings:
                 "button_hover_color": self.theme_colors["classic"]["button_hover"],
                 "active_color": self.theme_colors["classic"]["active"],
                 "particle_effects": True,
-                "screen_shake": True
+                "screen_shake": True,
+                "dirty_rect_rendering": True
             },
             "controls": {
                 "mouse_sensitivity": 1.0,
@@ -50,6 +51,16 @@ class Settings:
                     "launch": pygame.K_SPACE
                 }
             },
+            "performance": {
+                "frame_governor": True,
+                "simulation_rate": 120,
+                "target_fps": 60,
+                "sample_window": 60,
+                "degrade_threshold": 1.0,
+                "restore_threshold": 0.6,
+                "debug_overlay": False,
+                "asset_budget_mb": 64
+            },
             "gameplay": {
                 "difficulty": "normal",
                 "ball_speed": 1.0,
@@ -0,0 +1,94 @@
+import numpy as np
+
+class FixedTimestep:
+    """Oyun mantığını çizimden bağımsız, sabit adımlarla ilerleten zamanlayıcı.
+
+    Hızlar 60 FPS'lik kare başına tanımlıdır; her adımda nesnelere bu
+    cinsten dt (örn. 120 Hz için 0.5) verilir. Çizimde son iki adımın
+    konumları arasında ara değer kullanılır.
+    """
+    def __init__(self, rate=120, base_rate=60, max_steps=8, max_jump=64):
+        self.step_ms = 1000.0 / rate
+        self.dt = base_rate / rate  # Adım süresi (60 FPS karesi cinsinden)
+        self.max_steps = max_steps  # Yavaş karelerde birikimin sınırı
+        self.max_jump = max_jump  # Bundan uzun sıçramalar (sıfırlama vb.) ara değerlenmez
+        self.accumulator = 0.0
+
+        # Ara değerlenecek nesneler: (nesne listesi döndüren fonksiyon, öznitelikler)
+        self.tracked = []
+        self.previous = {}  # id(nesne) -> (nesne, önceki adımdaki değerler)
+
+    def track(self, provider, attributes):
+        self.tracked.append((provider, tuple(attributes)))
+
+    def reset(self):
+        """Biriken süreyi ve önceki durumu at (duraklatma, menü vb.)"""
+        self.accumulator = 0.0
+        self.previous.clear()
+
+    def advance(self, frame_ms):
+        """Kare süresini ekle, bu karede çalışacak adım sayısını döndür"""
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            # Çok yavaş kare: oyunu hızlandırmak yerine fazla süreyi at
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        return steps
+
+    def get_alpha(self):
+        """Son adımdan sonra geçen sürenin adım süresine oranı"""
+        return self.accumulator / self.step_ms
+
+    def save_state(self):
+        """Adım öncesi konumları kaydet (dizilerin kopyası alınır)"""
+        self.previous = {}
+        for provider, attributes in self.tracked:
+            for obj in provider():
+                self.previous[id(obj)] = (obj, tuple(self.copy_value(getattr(obj, name))
+                                                     for name in attributes))
+
+    def copy_value(self, value):
+        return value.copy() if isinstance(value, np.ndarray) else value
+
+    def interpolate(self):
+        """Nesneleri ara konumlarına taşı; geri almak için kaydı döndür.
+
+        NumPy dizisi öznitelikler (örn. top sistemi konumları) yerinde
+        değiştirilir; boyutu değişen diziler ara değerlenmez.
+        """
+        alpha = self.get_alpha()
+        restore = []
+        for provider, attributes in self.tracked:
+            for obj in provider():
+                saved = self.previous.get(id(obj))
+                if saved is None or saved[0] is not obj:
+                    continue
+                current = tuple(self.copy_value(getattr(obj, name)) for name in attributes)
+                if any(isinstance(c, np.ndarray) and c.shape != p.shape
+                       for c, p in zip(current, saved[1])):
+                    continue
+                if any(not isinstance(c, np.ndarray) and abs(c - p) > self.max_jump
+                       for c, p in zip(current, saved[1])):
+                    continue
+                restore.append((obj, attributes, current))
+                for name, prev, cur in zip(attributes, saved[1], current):
+                    if isinstance(cur, np.ndarray):
+                        # Tek tek sıçrayan elemanlar son konumda kalır
+                        value = np.where(np.abs(cur - prev) > self.max_jump, cur,
+                                         prev + (cur - prev) * alpha)
+                        getattr(obj, name)[...] = value
+                    else:
+                        setattr(obj, name, prev + (cur - prev) * alpha)
+        return restore
+
+    def restore(self, restore):
+        """interpolate() öncesi konumlara geri dön"""
+        for obj, attributes, values in restore:
+            for name, value in zip(attributes, values):
+                if isinstance(value, np.ndarray):
+                    getattr(obj, name)[...] = value
+                else:
+                    setattr(obj, name, value)
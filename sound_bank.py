@@ -0,0 +1,80 @@
+import os
+import pygame
+from voice_manager import VoiceManager
+from transcode_audio import load_manifest, resolve
+
+class SoundBank:
+    """Oyun içi ses efektlerinin önceden çözülmüş bankası.
+
+    Her ses dosyası bir kez çözülür ve anlamsal bir olay adına ("hit",
+    "block_break" vb.) bağlanır; play(olay) sadece sözlükten bakıp çalar,
+    dosya sistemine ya da çözücüye gitmez. transcode_audio.py ile dönüştürülmüş
+    bir çıktı varsa MP3 yerine o yüklenir. Sesler VoiceManager üzerinden,
+    olaya bağlanırken verilen kategori, öncelik, eş zamanlı örnek sınırı ve
+    tekrar aralığıyla çalınır.
+    """
+    def __init__(self, volume=0.5):
+        self.volume = volume
+        self.decoded = {}  # dosya yolu -> pygame.mixer.Sound (yüklenemediyse None)
+        self.events = {}  # olay adı -> (Sound, kategori, öncelik, en fazla örnek, aralık ms)
+        self.voices = VoiceManager()
+        self.manifest = load_manifest()  # transcode_audio.py çıktıları
+
+    def decode(self, path, volume=None):
+        """Dosyayı (ilk istekte) çöz ve döndür"""
+        if path not in self.decoded:
+            sound = None
+            try:
+                source = resolve(path, self.manifest)  # Varsa önceden dönüştürülmüş WAV/OGG
+                if os.path.exists(source):
+                    sound = pygame.mixer.Sound(source)
+                    sound.set_volume(self.volume if volume is None else volume)
+                else:
+                    print(f"Ses dosyası bulunamadı: {path}")
+            except Exception as e:
+                print(f"Ses dosyası yüklenemedi ({path}): {e}")
+            self.decoded[path] = sound
+        return self.decoded[path]
+
+    def preload(self, paths):
+        """Daha sonra bağlanacak dosyaları şimdiden çöz"""
+        for path in paths:
+            self.decode(path)
+
+    def bind(self, event, path, category="gameplay", priority=1, max_voices=4, interval=0, volume=None):
+        """Olayı bir ses dosyasına bağla (dosya gerekirse çözülür)"""
+        sound = self.decode(path, volume)
+        if sound is None:
+            self.unbind(event)
+        else:
+            self.events[event] = (sound, category, priority, max_voices, interval)
+
+    def unbind(self, event):
+        self.events.pop(event, None)
+
+    def bind_many(self, events, **profile):
+        for event, path in events.items():
+            self.bind(event, path, **profile)
+
+    def play(self, event, loops=0):
+        """Olayın sesini çal (bağlı değilse sessiz)"""
+        entry = self.events.get(event)
+        if entry is not None:
+            sound, category, priority, max_voices, interval = entry
+            try:
+                return self.voices.play(event, sound, category, priority, max_voices, interval, loops)
+            except Exception:
+                print(f"Ses çalınamadı: {event}")
+        return None
+
+    def stop(self, event):
+        self.voices.stop(event)
+
+    def get_stats(self):
+        stats = self.voices.get_stats()
+        stats["decoded"] = sum(1 for sound in self.decoded.values() if sound is not None)
+        stats["events"] = len(self.events)
+        return stats
+
+# Oyun, power-up ve menü seslerinin paylaştığı ses bankası
+sound_bank = SoundBank()
@@ -0,0 +1,84 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from ball_system import BallSystem
+from game_objects import BlockManager
+
+
+def make_blocks(seed):
+    random.seed(seed)
+    block_manager = BlockManager(800)
+    for row in range(6):
+        for col in range(12):
+            if random.random() < 0.8:
+                block_type = random.choice(["normal", "moving", "indestructible"])
+                block_manager.create_block(col * 65 + 10, row * 25 + 50, block_type, 0)
+    for block in random.sample(block_manager.blocks, len(block_manager.blocks) // 3):
+        block_manager.remove_block(block)
+    for _ in range(5):
+        block_manager.update(1.0)
+    return block_manager
+
+
+def test_get_cells_many_matches_get_cells():
+    block_manager = BlockManager(800)
+    rng = np.random.default_rng(0)
+    for count in (3, 40):
+        left = np.trunc(rng.uniform(-100, 800, count))
+        top = np.trunc(rng.uniform(-100, 600, count))
+        right = left + rng.integers(0, 150, count)
+        bottom = top + rng.integers(0, 60, count)
+        expected = set()
+        for rect in zip(left.tolist(), top.tolist(), (right - left).tolist(), (bottom - top).tolist()):
+            rect = pygame.Rect(rect)
+            if rect.width and rect.height:
+                expected.update(block_manager.get_cells(rect))
+        assert block_manager.get_cells_many(left, top, right, bottom) == expected
+
+
+def test_ball_hits_from_grid_candidates_match_brute_force():
+    for seed in range(20):
+        block_manager = make_blocks(seed)
+        for count in (5, 300):
+            balls = BallSystem()
+            for _ in range(count):
+                balls.spawn(random.uniform(0, 800), random.uniform(0, 250), 1, 1, random.choice([5, 8, 7.5]))
+            expected = []
+            for i in range(balls.count):
+                x, y = balls.pos[i]
+                r = balls.radius[i]
+                rect = pygame.Rect(x - r, y - r, r * 2, r * 2)
+                for block in block_manager.blocks:
+                    if rect.colliderect(block.rect):
+                        expected.append((i, block))
+                        break
+            assert balls.find_block_hits(block_manager) == expected
+
+
+def test_row_and_type_counts_follow_adds_and_removes():
+    block_manager = BlockManager(800)
+    for col in range(4):
+        block_manager.create_block(col * 65, 50, "normal", 0)
+        block_manager.create_block(col * 65, 75, "indestructible", 0)
+    assert block_manager.get_remaining_blocks() == 8
+    assert block_manager.count_type("normal") == 4
+    assert block_manager.destructible_count == 4
+
+    normal = block_manager.get_row(50)
+    block_manager.remove_block(normal[0])
+    block_manager.remove_blocks(normal[1:3] + block_manager.get_row(75)[:1])
+    assert block_manager.get_remaining_blocks() == 4
+    assert block_manager.count_type("normal") == 1
+    assert block_manager.count_type("indestructible") == 3
+    assert block_manager.destructible_count == 1
+    assert len(block_manager.get_row(50)) == 1
+
+    block_manager.clear()
+    assert block_manager.get_remaining_blocks() == 0
+    assert block_manager.count_type("indestructible") == 0
@@ -0,0 +1,34 @@
+import random
+
+import pygame
+
+from game_objects import BlockManager
+
+
+def reference_step(state, dt):
+    """Bloğun tek tek hareket kuralı (vektörel adımla aynı sonucu vermeli)"""
+    state["offset"] += state["speed"] * state["direction"] * dt
+    state["rect"].x = state["origin"] + state["offset"]  # pygame.Rect yuvarlaması
+    if abs(state["offset"]) > 50:
+        state["direction"] *= -1
+
+
+def test_step_matches_per_block_rule():
+    random.seed(0)
+    block_manager = BlockManager(800)
+    for col in range(10):
+        block_manager.create_block(col * 65 + 10, 50, "moving", 0)
+    blocks = block_manager.kinematics.blocks
+    for block in blocks:
+        block.move_speed = random.choice([0.7, 1, 1.3, 2.5])
+    block_manager.kinematics.speed[:] = [block.move_speed for block in blocks]
+    states = [{"rect": pygame.Rect(block.rect), "origin": block.original_x, "offset": 0.0,
+               "speed": block.move_speed, "direction": 1} for block in blocks]
+
+    for _ in range(300):
+        dt = random.choice([0.5, 1.0])
+        moved = block_manager.update(dt)
+        for state in states:
+            reference_step(state, dt)
+        assert [block.rect.x for block in blocks] == [state["rect"].x for state in states]
+        assert all(block_manager.field.x[block.slot] == block.rect.x for block in moved)
@@ -0,0 +1,136 @@
+import math
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from ball_system import BallSystem
+from game_logic import GameLogic
+from game_objects import Ball, BlockManager, Platform
+from game_states import GameState
+from particle_system import ParticleSystem
+from physics import block_normal, paddle_bounce, reflect, sweep_circle_rect, sweep_circle_walls
+from power_up_system import PowerUpManager
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
+
+
+def make_world(block_type="indestructible", x=370, y=300):
+    logic = GameLogic(SCREEN_WIDTH, SCREEN_HEIGHT)
+    platform = Platform(SCREEN_WIDTH, SCREEN_HEIGHT)
+    block_manager = BlockManager(SCREEN_WIDTH)
+    block_manager.create_block(x, y, block_type, 0)
+    ball = Ball(SCREEN_WIDTH, SCREEN_HEIGHT)
+    ball.active = True
+    return logic, platform, block_manager, ball
+
+
+def test_reflect_flips_normal_component():
+    assert reflect(3, -4, (0, 1)) == (3, 4)
+    assert reflect(3, -4, (-1, 0)) == (-3, -4)
+
+
+def test_paddle_bounce_matches_for_main_and_extra_balls():
+    logic, platform, block_manager, ball = make_world()
+    balls = BallSystem()
+    for x in (platform.rect.left + 5, platform.rect.centerx, platform.rect.right - 5):
+        ball.x, ball.y, ball.dx, ball.dy = x, platform.rect.top, 3.0, 4.0
+        logic.bounce_off_platform(ball, platform)
+        balls.clear()
+        balls.spawn(x, platform.rect.top + 2, 3.0, 4.0, ball.radius)
+        balls.collide_bounds(SCREEN_WIDTH, SCREEN_HEIGHT, platform)
+        assert np.allclose(balls.vel[0], (ball.dx, ball.dy))
+        assert ball.dy < 0 and math.isclose(math.hypot(ball.dx, ball.dy), 5.0)
+
+    xs = np.array([platform.rect.left, platform.rect.right], dtype=np.float64)
+    dx, dy = paddle_bounce(xs, np.full(2, 3.0), np.full(2, 4.0), platform.rect)
+    assert dx[0] > 0 > dx[1] and (dy < 0).all()
+
+
+def test_extra_ball_block_bounce_uses_block_normal():
+    logic, platform, block_manager, ball = make_world()
+    block = block_manager.blocks[0]
+    assert block_normal(block.rect.centerx, block.rect.bottom + 2, block.rect) == (0, 1)
+    assert block_normal(block.rect.left - 2, block.rect.centery, block.rect) == (-1, 0)
+
+    balls = BallSystem()
+    balls.spawn(block.rect.centerx, block.rect.bottom + 2, 1.0, -5.0, 8)
+    balls.bounce_off_block(0, block)
+    assert tuple(balls.vel[0]) == (1.0, 5.0)
+    # Zaten uzaklaşan top tekrar yansıtılmaz
+    balls.bounce_off_block(0, block)
+    assert tuple(balls.vel[0]) == (1.0, 5.0)
+
+
+def test_sweep_hits_thin_rect_crossed_in_one_step():
+    # 2 piksellik dikdörtgen, tek adımda 100 piksel ilerleyen dairenin yolunun ortasında
+    rect = pygame.Rect(0, 50, 100, 2)
+    hit = sweep_circle_rect(50, 100, 0, -100, 5, rect)
+    assert hit is not None
+    t, normal = hit
+    assert normal == (0, 1)
+    assert math.isclose(100 - 100 * t, rect.bottom + 5)
+
+
+def test_sweep_misses_rect_beside_path():
+    rect = pygame.Rect(0, 50, 100, 2)
+    assert sweep_circle_rect(120, 100, 0, -100, 5, rect) is None
+
+
+def test_sweep_walls_reports_earliest_wall():
+    t, normal = sweep_circle_walls(20, 100, -40, -10, 5, SCREEN_WIDTH)
+    assert normal == (1, 0)
+    assert math.isclose(t, 15 / 40)
+
+
+def test_fast_ball_does_not_tunnel_through_block():
+    logic, platform, block_manager, ball = make_world()
+    block = block_manager.blocks[0]
+    # Bir adımdaki hareket bloğun yüksekliği + top çapından uzun
+    ball.x, ball.y = block.rect.centerx, block.rect.bottom + 20
+    ball.dx, ball.dy = 0, -(block.rect.height + ball.radius * 2 + 30)
+
+    events = []
+    contacts = logic.move_ball(ball, platform, block_manager, events=events)
+
+    assert contacts and contacts[0]["target"] is block
+    assert contacts[0]["normal"] == (0, 1)
+    assert ball.dy > 0
+    assert ball.y - ball.radius >= block.rect.bottom
+    assert [event["type"] for event in events] == ["ball_block"]
+
+
+def test_fast_ball_breaks_only_first_block_in_path():
+    logic, platform, block_manager, ball = make_world("normal", y=300)
+    block_manager.create_block(370, 250, "normal", 0)
+    near, far = block_manager.blocks
+    ball.x, ball.y = near.rect.centerx, near.rect.bottom + 10
+    ball.dx, ball.dy = 0, -90
+
+    events = []
+    logic.move_ball(ball, platform, block_manager, events=events)
+
+    assert not block_manager.contains(near)
+    assert block_manager.contains(far)
+    assert ball.dy > 0
+
+
+def test_detection_has_no_particle_side_effects():
+    logic, platform, block_manager, ball = make_world("explosive", y=300)
+    block_manager.create_block(435, 300, "normal", 0)
+    logic.particles = ParticleSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+    block = block_manager.blocks[0]
+    ball.x, ball.y = block.rect.centerx, block.rect.bottom + 10
+    ball.dx, ball.dy = 0, -20
+
+    events = []
+    logic.move_ball(ball, platform, block_manager, events=events)
+    assert [event["type"] for event in events] == ["ball_block", "explosion"]
+    assert block_manager.get_remaining_blocks() == 0
+    assert logic.particles.count == 0
+
+    logic.apply_events(events, ball, platform, PowerUpManager(), GameState())
+    assert logic.particles.count > 0
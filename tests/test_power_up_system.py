@@ -0,0 +1,17 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from power_up_system import PowerUpManager
+
+
+def test_debug_power_ups_never_drop():
+    manager = PowerUpManager()
+    assert "chaos_ball" not in manager.drop_pool
+    assert "rapid_laser" not in manager.drop_pool
+    for _ in range(200):
+        manager.spawn_powerup(100, 100)
+    dropped = {power_up["type"] for power_up in manager.power_ups}
+    assert dropped <= set(manager.drop_pool)
+    assert "multi_ball" in manager.drop_pool and "laser" in manager.drop_pool
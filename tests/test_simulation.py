@@ -0,0 +1,85 @@
+import numpy as np
+
+from simulation import FixedTimestep
+
+
+class Body:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Swarm:
+    def __init__(self, positions):
+        self.positions = np.array(positions, dtype=np.float64)
+
+
+def test_advance_accumulates_partial_steps():
+    timestep = FixedTimestep(rate=100)  # 10 ms adım
+    assert timestep.advance(4) == 0
+    assert timestep.advance(4) == 0
+    assert timestep.advance(4) == 1
+    assert abs(timestep.accumulator - 2) < 1e-9
+    assert timestep.advance(25) == 2
+    assert abs(timestep.get_alpha() - 0.7) < 1e-9
+
+
+def test_advance_clamps_to_max_steps_and_drops_backlog():
+    timestep = FixedTimestep(rate=100, max_steps=3)
+    assert timestep.advance(1000) == 3
+    assert timestep.accumulator == 0.0
+    assert timestep.advance(10) == 1
+
+
+def test_interpolate_blends_and_restore_round_trips():
+    timestep = FixedTimestep(rate=100)
+    body = Body(10.0, 20.0)
+    swarm = Swarm([[0.0, 0.0], [100.0, 50.0]])
+    timestep.track(lambda: [body], ("x", "y"))
+    timestep.track(lambda: [swarm], ("positions",))
+
+    timestep.save_state()
+    body.x, body.y = 20.0, 40.0
+    swarm.positions += 10.0
+    timestep.advance(15)  # 1 adım + alpha 0.5
+
+    restore = timestep.interpolate()
+    assert (body.x, body.y) == (15.0, 30.0)
+    assert np.allclose(swarm.positions, [[5.0, 5.0], [105.0, 55.0]])
+
+    timestep.restore(restore)
+    assert (body.x, body.y) == (20.0, 40.0)
+    assert np.array_equal(swarm.positions, [[10.0, 10.0], [110.0, 60.0]])
+
+
+def test_interpolate_skips_jumps_longer_than_max_jump():
+    timestep = FixedTimestep(rate=100, max_jump=64)
+    body = Body(0.0, 0.0)
+    swarm = Swarm([[0.0, 0.0], [0.0, 0.0]])
+    timestep.track(lambda: [body], ("x", "y"))
+    timestep.track(lambda: [swarm], ("positions",))
+
+    timestep.save_state()
+    body.x = 500.0  # Sıfırlama gibi ani sıçrama
+    swarm.positions[0] = (300.0, 0.0)
+    swarm.positions[1] = (10.0, 0.0)
+    timestep.advance(15)
+
+    restore = timestep.interpolate()
+    assert (body.x, body.y) == (500.0, 0.0)
+    assert np.allclose(swarm.positions, [[300.0, 0.0], [5.0, 0.0]])
+    timestep.restore(restore)
+    assert np.array_equal(swarm.positions, [[300.0, 0.0], [10.0, 0.0]])
+
+
+def test_reset_discards_accumulator_and_saved_state():
+    timestep = FixedTimestep(rate=100)
+    body = Body(0.0, 0.0)
+    timestep.track(lambda: [body], ("x",))
+    timestep.save_state()
+    timestep.advance(5)
+    timestep.reset()
+    body.x = 10.0
+    assert timestep.get_alpha() == 0.0
+    assert timestep.interpolate() == []
+    assert body.x == 10.0
@@ -0,0 +1,42 @@
+import os
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from transcode_audio import resolve
+
+
+@pytest.fixture
+def mixer():
+    pygame.mixer.init(frequency=44100, size=-16, channels=2)
+    yield pygame.mixer.get_init()
+    pygame.mixer.quit()
+
+
+def make_manifest(tmp_path, rate, channels):
+    source = tmp_path / "hit.mp3"
+    output = tmp_path / "hit.wav"
+    source.write_bytes(b"mp3")
+    output.write_bytes(b"wav")
+    entry = {"kind": "effect", "output": str(output), "mtime": os.path.getmtime(source),
+             "rate": rate, "channels": channels}
+    return str(source), str(output), {str(source).replace(os.sep, "/"): entry}
+
+
+def test_resolve_uses_output_made_for_current_mixer(tmp_path, mixer):
+    source, output, manifest = make_manifest(tmp_path, mixer[0], mixer[2])
+    assert resolve(source, manifest) == output
+
+
+def test_resolve_falls_back_when_mixer_format_differs(tmp_path, mixer):
+    source, _, manifest = make_manifest(tmp_path, 22050, mixer[2])
+    assert resolve(source, manifest) == source
+    source, _, manifest = make_manifest(tmp_path, mixer[0], 1)
+    assert resolve(source, manifest) == source
+
+
+def test_resolve_falls_back_without_mixer(tmp_path):
+    source, _, manifest = make_manifest(tmp_path, 44100, 2)
+    assert resolve(source, manifest) == source
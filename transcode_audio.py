@@ -0,0 +1,138 @@
+"""Assests altındaki MP3 sesleri oyunun hızlı yükleyebileceği biçimlere dönüştürür.
+
+Kısa efektler mikserin örnekleme hızında, önceden çözülmüş WAV (PCM) olarak;
+müzikler (ffmpeg varsa) OGG olarak Assests/transcoded altına yazılır. Her
+kaynak, dosya özeti (sha1) ve değişme zamanıyla manifeste kaydedilir;
+değişmeyen kaynaklar yeniden dönüştürülmez. Oyundaki ses bankası manifestte
+güncel bir çıktısı olan sesleri kaynak yerine bu çıktılardan yükler.
+
+Kullanım: python transcode_audio.py [--force]
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import wave
+import pygame
+
+SOURCE_DIR = "Assests"
+OUTPUT_DIR = os.path.join(SOURCE_DIR, "transcoded")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+MUSIC_SECONDS = 20  # Bundan uzun sesler müzik sayılır
+
+def load_manifest(path=MANIFEST_PATH):
+    """Manifesti oku (yoksa boş döndür)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def resolve(path, manifest):
+    """Kaynak için güncel bir dönüştürülmüş çıktı varsa onun yolunu döndür.
+
+    Çıktı, açık mikserin örnekleme hızı ve kanal sayısıyla üretilmemişse
+    (farklı bir ses aygıtı vb.) yeniden örneklenmesin diye kaynak kullanılır.
+    """
+    entry = manifest.get(path.replace(os.sep, "/"))
+    if not entry or not entry.get("output") or not os.path.exists(entry["output"]):
+        return path
+    mixer = pygame.mixer.get_init()
+    if not mixer or (entry.get("rate"), entry.get("channels")) != (mixer[0], mixer[2]):
+        return path
+    try:
+        if os.path.getmtime(path) != entry["mtime"]:
+            return path  # Kaynak dönüştürmeden sonra değişmiş
+    except OSError:
+        pass  # Kaynak yoksa çıktı kullanılabilir
+    return entry["output"]
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def find_sources(root=SOURCE_DIR):
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if os.path.join(folder, d) != OUTPUT_DIR]
+        for name in sorted(files):
+            if name.lower().endswith(".mp3"):
+                yield os.path.join(folder, name).replace(os.sep, "/")
+
+def output_path(source, extension):
+    relative = os.path.relpath(source, SOURCE_DIR)
+    return os.path.join(OUTPUT_DIR, os.path.splitext(relative)[0] + extension).replace(os.sep, "/")
+
+def write_wav(sound, path, frequency, channels):
+    """Çözülmüş sesi mikser formatında (16 bit PCM) WAV olarak yaz"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(frequency)
+        f.writeframes(sound.get_raw())
+
+def encode_ogg(source, path, frequency):
+    """Müziği ffmpeg ile OGG Vorbis'e çevir (ffmpeg yoksa False)"""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    result = subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-i", source,
+                             "-c:a", "libvorbis", "-q:a", "4", "-ar", str(frequency), path])
+    return result.returncode == 0
+
+def transcode(source, frequency, channels):
+    """Kaynağı dönüştür, manifest kaydını (çıktı ve tür) döndür"""
+    sound = pygame.mixer.Sound(source)
+    if sound.get_length() > MUSIC_SECONDS:
+        path = output_path(source, ".ogg")
+        if encode_ogg(source, path, frequency):
+            return {"kind": "music", "output": path}
+        print(f"ffmpeg bulunamadı, müzik MP3 olarak kalıyor: {source}")
+        return {"kind": "music", "output": None}
+    path = output_path(source, ".wav")
+    write_wav(sound, path, frequency, channels)
+    return {"kind": "effect", "output": path}
+
+def build(force=False):
+    """Tüm kaynakları gerekiyorsa dönüştür ve manifesti yaz"""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # Ses aygıtı gerekmez
+    pygame.mixer.init(size=-16)
+    frequency, _, channels = pygame.mixer.get_init()
+
+    manifest = load_manifest()
+    updated = {}
+    for source in find_sources():
+        mtime = os.path.getmtime(source)
+        entry = manifest.get(source)
+        fresh = (entry and not force and entry.get("rate") == frequency and entry.get("channels") == channels
+                 and (os.path.exists(entry["output"]) if entry.get("output") else shutil.which("ffmpeg") is None))
+        if fresh and entry["mtime"] == mtime:
+            updated[source] = entry
+            continue
+        sha1 = file_hash(source)
+        if fresh and entry["sha1"] == sha1:
+            updated[source] = dict(entry, mtime=mtime)  # Sadece zaman damgası değişmiş
+            continue
+        try:
+            result = transcode(source, frequency, channels)
+        except Exception as e:
+            print(f"Ses dönüştürülemedi ({source}): {e}")
+            continue
+        updated[source] = dict(result, sha1=sha1, mtime=mtime, rate=frequency, channels=channels)
+        print(f"{source} -> {result['output']}")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(updated, f, ensure_ascii=False, indent=2, sort_keys=True)
+    pygame.mixer.quit()
+    return updated
+
+if __name__ == "__main__":
+    entries = build("--force" in sys.argv[1:])
+    print(f"{len(entries)} ses manifeste yazıldı: {MANIFEST_PATH}")
@@ -0,0 +1,64 @@
+import pygame
+from font_cache import render_text
+
+class Button:
+    """Normal, hover ve parlama durumları oluşturulurken bir kez çizilen buton"""
+    def __init__(self, rect, text, font, color, text_color, hover_color=None,
+                 hover_border=None, glow=False, border_radius=10):
+        self.rect = pygame.Rect(rect)
+        self.text = text
+        self.color = color
+        self.hover = False
+        self.glow_enabled = glow  # Kare süresi yetmezse kapatılabilir
+
+        if hover_color is None:
+            hover_color = tuple(min(c + 30, 255) for c in color)
+
+        # Durum yüzeyleri
+        text_surface = render_text(font, text, text_color)
+        self.surfaces = {
+            "normal": self.create_surface(color, text_surface, border_radius),
+            "hover": self.create_surface(hover_color, text_surface, border_radius, hover_border),
+            "glow": self.create_surface(hover_color, text_surface, border_radius, hover_border,
+                                        glow_color=hover_color + (128,)) if glow else None
+        }
+
+    def create_surface(self, color, text_surface, border_radius, border_color=None, glow_color=None):
+        """Bir buton durumunu kendi yüzeyine çiz"""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
+        # Buton arka planı ve kenarlığı
+        pygame.draw.rect(surface, color, rect, border_radius=border_radius)
+        if border_color:
+            pygame.draw.rect(surface, border_color, rect, 3, border_radius=border_radius)
+
+        # Buton metni
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+        # Yarı saydam vurgu efekti
+        if glow_color:
+            glow = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(glow, glow_color, rect, border_radius=border_radius)
+            surface.blit(glow, (0, 0))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def update(self, mouse_pos):
+        self.hover = self.rect.collidepoint(mouse_pos)
+
+    def get_surface(self):
+        """Buton durumuna uygun hazır yüzeyi döndür"""
+        if self.hover:
+            if self.glow_enabled and self.surfaces["glow"]:
+                return self.surfaces["glow"]
+            return self.surfaces["hover"]
+        return self.surfaces["normal"]
+
+    def draw(self, screen):
+        return screen.blit(self.get_surface(), self.rect)
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
@@ -0,0 +1,111 @@
+import pygame
+
+class VoiceManager:
+    """Mikser kanallarını kategorilere ayıran ses (voice) yöneticisi.
+
+    Her kategori (müzik, arayüz, oyun) kendi kanal aralığını kullanır, böylece
+    yoğun çarpışma sesleri level_up gibi önemli sesleri boğamaz. Her ses için
+    aynı anda çalan örnek sayısı sınırlanır ve aynı ses kısa aralıklarla
+    tekrar çalınmaz. Kategori doluysa en düşük öncelikli (eşitse en eski) ses
+    daha önemli olan yeni ses için durdurulur. Çalınamayan ve durdurulan sesler
+    sayılır.
+    """
+    def __init__(self, categories=None):
+        # kategori -> kanal sayısı (sırayla ardışık kanallara yerleşir)
+        self.categories = categories or {"music": 2, "ui": 4, "gameplay": 10}
+        self.ranges = {}  # kategori -> (ilk kanal, son kanal + 1)
+        start = 0
+        for category, count in self.categories.items():
+            self.ranges[category] = (start, start + count)
+            start += count
+        self.channel_count = start
+        self.channels = []  # Kanal indeksi -> pygame.mixer.Channel (open ile oluşur)
+
+        # Kanal başına çalan sesin bilgisi
+        self.voice_events = [None] * start
+        self.voice_priorities = [0] * start
+        self.voice_started = [0] * start
+
+        self.last_played = {}  # olay -> son çalınma zamanı (ms)
+
+        # İstatistikler
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def open(self):
+        """Mikser açıksa kanalları ayır; müzik ve arayüz kanallarını otomatik kullanımdan koru"""
+        if self.channels:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        if pygame.mixer.get_num_channels() < self.channel_count:
+            pygame.mixer.set_num_channels(self.channel_count)
+        reserved = self.channel_count - self.categories.get("gameplay", 0)
+        pygame.mixer.set_reserved(reserved)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        return True
+
+    def play(self, event, sound, category="gameplay", priority=1, max_voices=4, interval=0, loops=0):
+        """Sesi kategorisinin kanallarından birinde çal; çalınamazsa None döndür"""
+        if not self.open():
+            return None
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(event)
+        if interval and last is not None and now - last < interval:
+            self.dropped += 1
+            return None
+
+        first, end = self.ranges[category]
+        free = None
+        instances = 0
+        victim = None
+        victim_priority = victim_started = 0
+        for i in range(first, end):
+            if not self.channels[i].get_busy():
+                if free is None:
+                    free = i
+                continue
+            if self.voice_events[i] == event:
+                instances += 1
+            # Çalan sesler arasında en düşük öncelikli, eşitse en eski olan
+            voice_priority = self.voice_priorities[i]
+            if (victim is None or voice_priority < victim_priority or
+                    (voice_priority == victim_priority and self.voice_started[i] < victim_started)):
+                victim = i
+                victim_priority = voice_priority
+                victim_started = self.voice_started[i]
+
+        if instances >= max_voices:
+            self.dropped += 1
+            return None
+        if free is None:
+            if victim is None or victim_priority > priority:
+                self.dropped += 1
+                return None
+            self.channels[victim].stop()
+            self.stolen += 1
+            free = victim
+
+        channel = self.channels[free]
+        channel.play(sound, loops)
+        self.voice_events[free] = event
+        self.voice_priorities[free] = priority
+        self.voice_started[free] = now
+        self.last_played[event] = now
+        self.played += 1
+        return channel
+
+    def stop(self, event):
+        """Olayın çalan tüm örneklerini durdur"""
+        for i, channel in enumerate(self.channels):
+            if self.voice_events[i] == event and channel.get_busy():
+                channel.stop()
+
+    def get_stats(self):
+        return {
+            "played": self.played,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+            "busy": sum(1 for channel in self.channels if channel.get_busy())
+        }